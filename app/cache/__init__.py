@@ -0,0 +1,5 @@
+from .base import BaseCache
+from .null_cache import NullCache
+from .redis_cache import RedisCache
+
+__all__ = ["BaseCache", "NullCache", "RedisCache"]
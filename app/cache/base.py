@@ -0,0 +1,46 @@
+"""
+Base cache demonstrating Interface Segregation Principle (ISP)
+and Open/Closed Principle (OCP)
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Union
+
+
+class BaseCache(ABC):
+	"""
+	Abstract key-value cache following ISP and OCP principles
+
+	ISP: Interface exposes only the operations the application needs
+	OCP: Open for extension (new cache backends) but closed for modification
+	"""
+
+	@abstractmethod
+	async def get(self, key: str) -> Optional[bytes]:
+		"""Get a cached value"""
+		pass
+
+	@abstractmethod
+	async def get_many(self, *keys: str) -> List[Optional[bytes]]:
+		"""Get several cached values in a single round trip"""
+		pass
+
+	@abstractmethod
+	async def set(self, key: str, value: Union[str, bytes], ttl: int) -> None:
+		"""Store a value that expires after ttl seconds"""
+		pass
+
+	@abstractmethod
+	async def delete(self, *keys: str) -> None:
+		"""Delete cached values"""
+		pass
+
+	@abstractmethod
+	async def incr(self, key: str) -> int:
+		"""Atomically increment a counter and return its new value"""
+		pass
+
+	@abstractmethod
+	async def close(self) -> None:
+		"""Release backend connections"""
+		pass
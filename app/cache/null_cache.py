@@ -0,0 +1,38 @@
+"""
+No-op cache implementation demonstrating
+Liskov Substitution Principle (LSP)
+"""
+
+from typing import List, Optional, Union
+
+from app.cache.base import BaseCache
+
+
+class NullCache(BaseCache):
+	"""
+	Cache that never stores anything
+
+	LSP: Can be substituted for BaseCache so callers need no special
+	casing when caching is disabled
+	"""
+
+	async def get(self, key: str) -> Optional[bytes]:
+		"""Always report a cache miss"""
+		return None
+
+	async def get_many(self, *keys: str) -> List[Optional[bytes]]:
+		"""Always report a cache miss for every key"""
+		return [None] * len(keys)
+
+	async def set(self, key: str, value: Union[str, bytes], ttl: int) -> None:
+		"""Discard the value"""
+
+	async def delete(self, *keys: str) -> None:
+		"""Nothing to delete"""
+
+	async def incr(self, key: str) -> int:
+		"""Counters are not tracked"""
+		return 0
+
+	async def close(self) -> None:
+		"""No connections to release"""
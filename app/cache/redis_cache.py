@@ -0,0 +1,139 @@
+"""
+Redis cache implementation demonstrating
+Liskov Substitution Principle (LSP)
+and Dependency Inversion Principle (DIP)
+"""
+
+import logging
+from typing import Any, Awaitable, List, Optional, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.cache.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache(BaseCache):
+	"""
+	Redis-backed cache implementation
+
+	LSP: Can be substituted for BaseCache without breaking functionality
+	SRP: Only responsible for talking to Redis
+
+	The cache is an optimization: Redis failures are logged and treated
+	as misses or no-ops so requests keep being served from the database
+	"""
+
+	def __init__(self, client: Redis):
+		"""
+		Initialize cache with a Redis client
+
+		Args:
+			client: redis.asyncio client
+		"""
+		self._client = client
+		logger.info("RedisCache initialized")
+
+	@classmethod
+	def from_url(cls, url: str) -> "RedisCache":
+		"""
+		Create a cache connected to the given Redis URL
+
+		Args:
+			url: Redis connection URL
+
+		Returns:
+			RedisCache instance
+		"""
+		return cls(Redis.from_url(url))
+
+	async def get(self, key: str) -> Optional[bytes]:
+		"""
+		Get a cached value
+
+		Args:
+			key: Cache key
+
+		Returns:
+			Cached value if present, None otherwise
+		"""
+		return await self._guard(self._client.get(key), None)
+
+	async def get_many(self, *keys: str) -> List[Optional[bytes]]:
+		"""
+		Get several cached values with a single MGET
+
+		Args:
+			keys: Cache keys
+
+		Returns:
+			Cached values in key order, None for missing keys
+		"""
+		return await self._guard(self._client.mget(keys), [None] * len(keys))
+
+	async def set(self, key: str, value: Union[str, bytes], ttl: int) -> None:
+		"""
+		Store a value with an expiration
+
+		Args:
+			key: Cache key
+			value: Value to store
+			ttl: Time to live in seconds
+		"""
+		await self._guard(self._client.set(key, value, ex=ttl), None)
+
+	async def delete(self, *keys: str) -> None:
+		"""
+		Delete cached values
+
+		Args:
+			keys: Cache keys to delete
+		"""
+		if keys:
+			await self._guard(self._client.delete(*keys), None)
+
+	async def incr(self, key: str) -> int:
+		"""
+		Atomically increment a counter
+
+		Args:
+			key: Counter key
+
+		Returns:
+			New counter value
+		"""
+		try:
+			return await self._client.incr(key)
+		except RedisError as e:
+			# Versions are bumped to invalidate: entries tagged with the old
+			# version stay valid until they expire
+			logger.error(
+				"Redis INCR of %s failed, cached entries may be stale: %s",
+				key,
+				e,
+			)
+			return 0
+
+	async def _guard(self, command: Awaitable[Any], fallback: Any) -> Any:
+		"""
+		Await a Redis command, falling back when Redis is unavailable
+
+		Args:
+			command: Pending Redis command
+			fallback: Value returned if the command fails
+
+		Returns:
+			Command result, or fallback on a Redis error
+		"""
+		try:
+			return await command
+		except RedisError as e:
+			logger.warning("Redis unavailable, bypassing cache: %s", e)
+			return fallback
+
+	async def close(self) -> None:
+		"""Close the Redis connection pool"""
+		await self._client.aclose()
+		logger.info("Redis connections closed")
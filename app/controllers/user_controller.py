@@ -4,20 +4,18 @@ and Dependency Inversion Principle (DIP)
 """
 
 import logging
-from math import ceil
-from typing import Annotated
+from typing import Annotated, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.cache.base import BaseCache
+from app.database import get_db, get_read_db
 from app.dependencies.container import Container
-from app.exceptions.user_exceptions import (
-	UserAlreadyExistsError,
-	UserNotFoundError,
-)
 from app.models.user import (
 	UserCreate,
 	UserListResponse,
@@ -28,6 +26,44 @@ from app.services.base import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Cache settings for user reads
+CACHE_TTL_SECONDS = 30
+# Every cached user entry is tagged with this version; writes bump it
+USERS_VERSION_KEY = "users:version"
+
+# Shared session dependencies, resolved once per request across all routes;
+# reads use a session that is never committed
+SessionDep = Annotated[AsyncSession, Depends(get_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+# Prebuilt UserResponse validator, bound once instead of per call
+_validate_user = UserResponse.__pydantic_validator__.validate_python
+# Fields of a listed user, taken from UserResponse so both stay in sync
+_USER_FIELDS = tuple(UserResponse.model_fields)
+
+
+def _json_response(
+	model: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+	"""
+	Wrap an already validated model in a JSON response
+
+	FastAPI passes Response instances through untouched, so the model is
+	not validated a second time against the route's response_model
+
+	Args:
+		model: Response model built by the handler
+		status_code: HTTP status code
+
+	Returns:
+		JSON response
+	"""
+	return Response(
+		content=model.model_dump_json(),
+		status_code=status_code,
+		media_type="application/json",
+	)
+
 
 class UserController:
 	"""
@@ -37,6 +73,61 @@ class UserController:
 	DIP: Depends on abstraction (BaseService) not concrete implementation
 	"""
 
+	# Route table shared by all instances: (path, handler, method, options)
+	_ROUTES = (
+		(
+			"",
+			"create_user",
+			"POST",
+			{
+				"status_code": status.HTTP_201_CREATED,
+				"response_model": UserResponse,
+				"summary": "Create a new user",
+				"description": "Create a new user with name and email",
+			},
+		),
+		(
+			"/{user_id}",
+			"get_user",
+			"GET",
+			{
+				"response_model": UserResponse,
+				"summary": "Get user by ID",
+				"description": "Retrieve a user by their unique identifier",
+			},
+		),
+		(
+			"",
+			"get_users",
+			"GET",
+			{
+				"response_model": UserListResponse,
+				"summary": "Get all users",
+				"description": "Retrieve all users with pagination support",
+			},
+		),
+		(
+			"/{user_id}",
+			"update_user",
+			"PUT",
+			{
+				"response_model": UserResponse,
+				"summary": "Update user",
+				"description": "Update an existing user's information",
+			},
+		),
+		(
+			"/{user_id}",
+			"delete_user",
+			"DELETE",
+			{
+				"status_code": status.HTTP_204_NO_CONTENT,
+				"summary": "Delete user",
+				"description": "Delete a user by their unique identifier",
+			},
+		),
+	)
+
 	def __init__(self, container: Container):
 		"""
 		Initialize user controller with dependency injection
@@ -44,8 +135,13 @@ class UserController:
 		Args:
 			container: Dependency injection container
 		"""
-		self.router = APIRouter()
+		self.router = APIRouter(
+			prefix="/users",
+			tags=["users"],
+			default_response_class=ORJSONResponse,
+		)
 		self._container = container
+		self._cache: BaseCache = container.cache()
 		self._setup_routes()
 		logger.info("UserController initialized")
 
@@ -53,59 +149,85 @@ class UserController:
 		"""Get user service from container"""
 		return self._container.user_service(session)
 
-	def _setup_routes(self):
-		"""Setup API routes"""
-		self.router.add_api_route(
-			"/users",
-			self.create_user,
-			methods=["POST"],
-			status_code=status.HTTP_201_CREATED,
-			response_model=UserResponse,
-			summary="Create a new user",
-			description="Create a new user with name and email",
-		)
+	@staticmethod
+	def _user_cache_key(user_id: UUID) -> str:
+		"""Build cache key for a single user"""
+		return f"users:id:{user_id}"
 
-		self.router.add_api_route(
-			"/users/{user_id}",
-			self.get_user,
-			methods=["GET"],
-			response_model=UserResponse,
-			summary="Get user by ID",
-			description="Retrieve a user by their unique identifier",
-		)
+	@staticmethod
+	def _user_list_cache_key(page: int, per_page: int) -> str:
+		"""Build cache key for a page of users"""
+		return f"users:list:{page}:{per_page}"
 
-		self.router.add_api_route(
-			"/users",
-			self.get_users,
-			methods=["GET"],
-			response_model=UserListResponse,
-			summary="Get all users",
-			description="Retrieve all users with pagination support",
-		)
+	async def _get_versioned(
+		self, cache_key: str
+	) -> Tuple[bytes, Optional[bytes]]:
+		"""
+		Read a cached user entry and the current users version
+
+		Both come from a single MGET, so a hit costs one round trip
+
+		Args:
+			cache_key: Key of the cached entry
 
-		self.router.add_api_route(
-			"/users/{user_id}",
-			self.update_user,
-			methods=["PUT"],
-			response_model=UserResponse,
-			summary="Update user",
-			description="Update an existing user's information",
+		Returns:
+			Tuple of (current version, cached body or None when missing
+			or tagged with an older version)
+		"""
+		version, cached = await self._cache.get_many(
+			USERS_VERSION_KEY, cache_key
 		)
+		version = version or b"0"
+		if cached is not None:
+			cached_version, _, body = cached.partition(b":")
+			if cached_version == version:
+				return version, body
+		return version, None
+
+	async def _set_versioned(
+		self, cache_key: str, version: bytes, body: bytes
+	) -> None:
+		"""
+		Cache a user entry tagged with the version read before loading it
 
-		self.router.add_api_route(
-			"/users/{user_id}",
-			self.delete_user,
-			methods=["DELETE"],
-			status_code=status.HTTP_204_NO_CONTENT,
-			summary="Delete user",
-			description="Delete a user by their unique identifier",
+		Args:
+			cache_key: Key of the cached entry
+			version: Users version returned by _get_versioned
+			body: JSON body to cache
+		"""
+		await self._cache.set(
+			cache_key, version + b":" + body, CACHE_TTL_SECONDS
 		)
 
+	async def _commit_then_invalidate(self, session: AsyncSession):
+		"""
+		Commit the request's writes, then invalidate the cached users
+
+		Cached entries are tagged with the users version read before their
+		data was loaded. Bumping the version only after the commit means an
+		entry built from pre-commit data always carries an older version,
+		even when it is stored after the bump, and is never served. If the
+		bump itself fails, stale entries live until CACHE_TTL_SECONDS
+
+		Args:
+			session: Database session holding the request's writes
+		"""
+		await session.commit()
+		await self._cache.incr(USERS_VERSION_KEY)
+
+	def _setup_routes(self):
+		"""Setup API routes from the route table"""
+		add_api_route = self.router.add_api_route
+		for path, handler, method, options in self._ROUTES:
+			add_api_route(
+				path, getattr(self, handler), methods=[method], **options
+			)
+
 	async def create_user(
 		self,
 		user_data: UserCreate,
-		session: AsyncSession = Depends(get_db),
-	) -> UserResponse:
+		session: SessionDep,
+	) -> Response:
 		"""
 		Create a new user
 
@@ -114,34 +236,25 @@ class UserController:
 			session: Database session
 
 		Returns:
-			Created user response
+			JSON response with the created user
 
 		Raises:
-			HTTPException: If user already exists or validation fails
+			UserAlreadyExistsError: If user already exists
 		"""
 		user_service = self._get_user_service(session)
 
-		try:
-			logger.info(f"Creating user via API: {user_data.email}")
-			user = await user_service.create(user_data)
-			return UserResponse.model_validate(user)
-		except UserAlreadyExistsError as e:
-			logger.warning(f"User creation failed: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_409_CONFLICT, detail=str(e)
-			)
-		except Exception as e:
-			logger.error(f"Unexpected error creating user: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-				detail="Internal server error",
-			)
+		logger.info("Creating user via API: %s", user_data.email)
+		user = await user_service.create(user_data)
+		await self._commit_then_invalidate(session)
+		return _json_response(
+			_validate_user(user, from_attributes=True), status.HTTP_201_CREATED
+		)
 
 	async def get_user(
 		self,
 		user_id: UUID,
-		session: AsyncSession = Depends(get_db),
-	) -> UserResponse:
+		session: ReadSessionDep,
+	) -> Response:
 		"""
 		Get user by ID
 
@@ -150,81 +263,82 @@ class UserController:
 			session: Database session
 
 		Returns:
-			User response
+			JSON response with the user
 
 		Raises:
-			HTTPException: If user is not found
+			UserNotFoundError: If user is not found
 		"""
 		user_service = self._get_user_service(session)
 
-		try:
-			logger.info(f"Getting user via API: {user_id}")
-			user = await user_service.get_by_id(user_id)
-			return UserResponse.model_validate(user)
-		except UserNotFoundError as e:
-			logger.warning(f"User not found: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
-			)
-		except Exception as e:
-			logger.error(f"Unexpected error getting user: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-				detail="Internal server error",
-			)
+		logger.info("Getting user via API: %s", user_id)
+		cache_key = self._user_cache_key(user_id)
+		version, cached = await self._get_versioned(cache_key)
+		if cached is not None:
+			return Response(content=cached, media_type="application/json")
+
+		user = await user_service.get_by_id(user_id)
+		response = _json_response(_validate_user(user, from_attributes=True))
+		await self._set_versioned(cache_key, version, response.body)
+		return response
 
 	async def get_users(
 		self,
+		session: ReadSessionDep,
 		page: Annotated[int, Query(ge=1, description="Page number")] = 1,
 		per_page: Annotated[
 			int, Query(ge=1, le=100, description="Items per page")
 		] = 10,
-		session: AsyncSession = Depends(get_db),
-	) -> UserListResponse:
+	) -> Response:
 		"""
 		Get all users with pagination
 
 		Args:
+			session: Database session
 			page: Page number (1-indexed)
 			per_page: Items per page
-			session: Database session
 
 		Returns:
-			Paginated user list response
+			JSON response with the paginated user list
 		"""
 		user_service = self._get_user_service(session)
 
-		try:
-			skip = (page - 1) * per_page
-			logger.info(
-				f"Getting users via API: page={page}, per_page={per_page}"
-			)
-
-			users, total_count = await user_service.get_all(skip, per_page)
-			total_pages = (
-				ceil(total_count / per_page) if total_count > 0 else 1
-			)
+		skip = (page - 1) * per_page
+		logger.info(
+			"Getting users via API: page=%s, per_page=%s", page, per_page
+		)
 
-			return UserListResponse(
-				users=[UserResponse.model_validate(user) for user in users],
-				total=total_count,
-				page=page,
-				per_page=per_page,
-				total_pages=total_pages,
-			)
-		except Exception as e:
-			logger.error(f"Unexpected error getting users: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-				detail="Internal server error",
-			)
+		cache_key = self._user_list_cache_key(page, per_page)
+		version, cached = await self._get_versioned(cache_key)
+		if cached is not None:
+			return Response(content=cached, media_type="application/json")
+
+		users, total_count = await user_service.get_all(skip, per_page)
+		total_pages = max(1, (total_count + per_page - 1) // per_page)
+
+		# Encode the page straight from the domain models in one pass,
+		# bypassing per-item Pydantic serialization
+		body = orjson.dumps(
+			{
+				"users": [
+					{field: getattr(user, field) for field in _USER_FIELDS}
+					for user in users
+				],
+				"total": total_count,
+				"page": page,
+				"per_page": per_page,
+				"total_pages": total_pages,
+			},
+			option=orjson.OPT_UTC_Z,
+		)
+		await self._set_versioned(cache_key, version, body)
+		return Response(content=body, media_type="application/json")
 
 	async def update_user(
 		self,
 		user_id: UUID,
 		user_data: UserUpdate,
-		session: AsyncSession = Depends(get_db),
-	) -> UserResponse:
+		session: SessionDep,
+	) -> Response:
 		"""
 		Update user
 
@@ -234,39 +348,24 @@ class UserController:
 			session: Database session
 
 		Returns:
-			Updated user response
+			JSON response with the updated user
 
 		Raises:
-			HTTPException: If user is not found or email already exists
+			UserNotFoundError: If user is not found
+			UserAlreadyExistsError: If email already exists
 		"""
 		user_service = self._get_user_service(session)
 
-		try:
-			logger.info(f"Updating user via API: {user_id}")
-			user = await user_service.update(user_id, user_data)
-			return UserResponse.model_validate(user)
-		except UserNotFoundError as e:
-			logger.warning(f"User not found for update: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
-			)
-		except UserAlreadyExistsError as e:
-			logger.warning(f"User update failed: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_409_CONFLICT, detail=str(e)
-			)
-		except Exception as e:
-			logger.error(f"Unexpected error updating user: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-				detail="Internal server error",
-			)
+		logger.info("Updating user via API: %s", user_id)
+		user = await user_service.update(user_id, user_data)
+		await self._commit_then_invalidate(session)
+		return _json_response(_validate_user(user, from_attributes=True))
 
 	async def delete_user(
 		self,
 		user_id: UUID,
-		session: AsyncSession = Depends(get_db),
-	) -> JSONResponse:
+		session: SessionDep,
+	) -> Response:
 		"""
 		Delete user
 
@@ -278,22 +377,13 @@ class UserController:
 			Empty response with 204 status
 
 		Raises:
-			HTTPException: If user is not found
+			UserNotFoundError: If user is not found
 		"""
 		user_service = self._get_user_service(session)
 
-		try:
-			logger.info(f"Deleting user via API: {user_id}")
-			await user_service.delete(user_id)
-			return Response(status_code=status.HTTP_204_NO_CONTENT)
-		except UserNotFoundError as e:
-			logger.warning(f"User not found for deletion: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
-			)
-		except Exception as e:
-			logger.error(f"Unexpected error deleting user: {str(e)}")
-			raise HTTPException(
-				status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-				detail="Internal server error",
-			)
+		logger.info("Deleting user via API: %s", user_id)
+		await user_service.delete(user_id)
+		await self._commit_then_invalidate(session)
+		# A fresh instance per request: FastAPI attaches background tasks
+		# to the returned Response, so a shared one would leak them
+		return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -4,27 +4,77 @@ Following Dependency Inversion Principle (DIP)
 """
 
 import logging
+import os
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
 	AsyncSession,
 	async_sessionmaker,
 	create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 logger = logging.getLogger(__name__)
 
 # Database configuration
-DATABASE_URL = "sqlite+aiosqlite:///./app.db"
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
 
-# Create async engine
+# Connections held per worker process: pool_size stay open, max_overflow
+# more are opened under bursts. Keep (pool_size + max_overflow) x workers
+# below the server's max_connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
+# SQLite connections are shared across the pool's worker threads
+CONNECT_ARGS = (
+	{"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+)
+
+# Create async engine with a pooled set of reusable connections
 engine = create_async_engine(
 	DATABASE_URL,
-	echo=True,  # Set to False in production
+	echo=False,
 	future=True,
+	poolclass=AsyncAdaptedQueuePool,
+	pool_size=DB_POOL_SIZE,
+	max_overflow=DB_MAX_OVERFLOW,
+	pool_timeout=30,
+	pool_recycle=1800,
+	pool_pre_ping=True,
+	connect_args=CONNECT_ARGS,
 )
 
+# SQLite tuning applied to every new connection: WAL lets readers run
+# alongside a writer and synchronous=NORMAL drops the fsync per commit
+SQLITE_PRAGMAS = (
+	"PRAGMA journal_mode=WAL",
+	"PRAGMA synchronous=NORMAL",
+	"PRAGMA temp_store=MEMORY",
+	"PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+	"""
+	Apply SQLite performance pragmas to a freshly opened connection
+
+	Args:
+		dbapi_connection: Raw DBAPI connection
+		connection_record: Pool connection record (unused)
+	"""
+	cursor = dbapi_connection.cursor()
+	try:
+		for pragma in SQLITE_PRAGMAS:
+			cursor.execute(pragma)
+	finally:
+		cursor.close()
+
+
+if DATABASE_URL.startswith("sqlite"):
+	event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
 	engine,
@@ -56,13 +106,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 			logger.debug("Database session committed")
 		except Exception as e:
 			await session.rollback()
-			logger.error(f"Database session rolled back due to error: {e}")
+			logger.error("Database session rolled back due to error: %s", e)
 			raise
 		finally:
 			await session.close()
 			logger.debug("Database session closed")
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+	"""
+	Dependency function to get a read-only database session
+
+	Yields:
+		AsyncSession: Database session
+
+	Nothing is committed: the implicit transaction is rolled back when
+	the session closes, so reads skip the commit round trip
+	"""
+	async with AsyncSessionLocal() as session:
+		logger.debug("Read-only database session created")
+		yield session
+
+
 async def init_db():
 	"""
 	Initialize database tables
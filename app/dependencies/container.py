@@ -4,9 +4,14 @@ Dependency Inversion Principle (DIP)
 """
 
 import logging
+import os
+from weakref import WeakValueDictionary
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.base import BaseCache
+from app.cache.null_cache import NullCache
+from app.cache.redis_cache import RedisCache
 from app.repositories.user_repository import UserRepository
 from app.services.user_service import UserService
 
@@ -21,6 +26,36 @@ class Container:
 	This container manages the creation and injection of dependencies
 	"""
 
+	def __init__(self):
+		"""
+		Initialize container and its application-wide singletons
+
+		The cache is backed by Redis when REDIS_URL is set, otherwise
+		caching is disabled
+		"""
+		redis_url = os.getenv("REDIS_URL")
+		if redis_url:
+			self._cache: BaseCache = RedisCache.from_url(redis_url)
+		else:
+			self._cache = NullCache()
+		# Services are reused for as long as their session is alive;
+		# a live service keeps its session alive, so ids cannot be recycled
+		self._user_services: WeakValueDictionary[int, UserService] = (
+			WeakValueDictionary()
+		)
+		logger.info(
+			"Container initialized with %s", type(self._cache).__name__
+		)
+
+	def cache(self) -> BaseCache:
+		"""
+		Get the shared cache instance
+
+		Returns:
+			BaseCache implementation
+		"""
+		return self._cache
+
 	def user_repository(self, session: AsyncSession) -> UserRepository:
 		"""
 		Get user repository instance
@@ -42,10 +77,17 @@ class Container:
 			session: Database session
 
 		Returns:
-			UserService instance with injected dependencies
+			UserService instance with injected dependencies, shared by
+			every resolution that uses the same session
 		"""
-		# Dependency injection: UserService depends on
-		# UserRepository abstraction
-		user_repository = self.user_repository(session)
-		logger.info("Creating UserService instance with injected dependencies")
-		return UserService(user_repository)
+		user_service = self._user_services.get(id(session))
+		if user_service is None:
+			# Dependency injection: UserService depends on
+			# UserRepository abstraction
+			user_repository = self.user_repository(session)
+			logger.info(
+				"Creating UserService instance with injected dependencies"
+			)
+			user_service = UserService(user_repository)
+			self._user_services[id(session)] = user_service
+		return user_service
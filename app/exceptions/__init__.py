@@ -1,3 +1,8 @@
+from .handlers import register_exception_handlers
 from .user_exceptions import UserAlreadyExistsError, UserNotFoundError
 
-__all__ = ["UserNotFoundError", "UserAlreadyExistsError"]
+__all__ = [
+	"UserNotFoundError",
+	"UserAlreadyExistsError",
+	"register_exception_handlers",
+]
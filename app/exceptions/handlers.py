@@ -0,0 +1,64 @@
+"""
+Exception handlers translating domain errors into HTTP responses
+Demonstrates Single Responsibility Principle (SRP)
+"""
+
+import logging
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.exceptions.user_exceptions import (
+	UserAlreadyExistsError,
+	UserNotFoundError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def user_not_found_handler(
+	request: Request, exc: UserNotFoundError
+) -> ORJSONResponse:
+	"""Map UserNotFoundError to 404 Not Found"""
+	logger.warning("User not found: %s", exc)
+	return ORJSONResponse(
+		status_code=status.HTTP_404_NOT_FOUND, content={"detail": exc.message}
+	)
+
+
+async def user_already_exists_handler(
+	request: Request, exc: UserAlreadyExistsError
+) -> ORJSONResponse:
+	"""Map UserAlreadyExistsError to 409 Conflict"""
+	logger.warning("User already exists: %s", exc)
+	return ORJSONResponse(
+		status_code=status.HTTP_409_CONFLICT, content={"detail": exc.message}
+	)
+
+
+async def unhandled_exception_handler(
+	request: Request, exc: Exception
+) -> ORJSONResponse:
+	"""Map any unexpected error to 500 Internal Server Error"""
+	logger.error("Unexpected error handling %s: %s", request.url.path, exc)
+	return ORJSONResponse(
+		status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+		content={"detail": "Internal server error"},
+	)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+	"""
+	Register domain exception handlers on the application
+
+	SRP: Controllers only handle the happy path; mapping errors to
+	HTTP responses lives here
+
+	Args:
+		app: FastAPI application
+	"""
+	app.add_exception_handler(UserNotFoundError, user_not_found_handler)
+	app.add_exception_handler(
+		UserAlreadyExistsError, user_already_exists_handler
+	)
+	app.add_exception_handler(Exception, unhandled_exception_handler)
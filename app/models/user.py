@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class UserBase(BaseModel):
@@ -39,6 +39,18 @@ class UserUpdate(BaseModel):
 	)
 	email: Optional[EmailStr] = Field(None, description="User's email address")
 
+	@field_validator("name", "email")
+	@classmethod
+	def reject_null(cls, value):
+		"""
+		Reject explicit nulls; omit a field to leave it unchanged
+
+		Defaults are not validated, so omitted fields still become None
+		"""
+		if value is None:
+			raise ValueError("must not be null")
+		return value
+
 
 class User(UserBase):
 	"""
@@ -71,7 +83,11 @@ class UserResponse(UserBase):
 	created_at: datetime
 	updated_at: datetime
 
-	model_config = ConfigDict(from_attributes=True)
+	# Responses are built once and only serialized afterwards; freezing
+	# them keeps assignment from ever needing validation
+	model_config = ConfigDict(
+		from_attributes=True, validate_assignment=False, frozen=True
+	)
 
 
 class UserListResponse(BaseModel):
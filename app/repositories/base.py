@@ -3,8 +3,9 @@ Base repository demonstrating Interface Segregation Principle (ISP)
 and Open/Closed Principle (OCP)
 """
 
+import inspect
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
 T = TypeVar("T")
@@ -16,8 +17,29 @@ class BaseRepository(Generic[T], ABC):
 
 	ISP: Interface is focused and minimal
 	OCP: Open for extension (new repository types) but closed for modification
+
+	Unit of work: repositories never commit. Write handlers commit the
+	request-scoped session (get_db) once their writes are done, before
+	invalidating caches; implementations only flush when they need
+	database-generated state before then
 	"""
 
+	def __init_subclass__(cls, **kwargs):
+		"""
+		Ensure implementations never block the event loop
+
+		Raises:
+			TypeError: If an interface method is implemented as a
+				regular (blocking) function
+		"""
+		super().__init_subclass__(**kwargs)
+		for name in BaseRepository.__abstractmethods__:
+			method = getattr(cls, name, None)
+			if method is not None and not inspect.iscoroutinefunction(method):
+				raise TypeError(
+					f"{cls.__name__}.{name} must be an async method"
+				)
+
 	@abstractmethod
 	async def create(self, entity: T) -> T:
 		"""Create a new entity"""
@@ -33,6 +55,13 @@ class BaseRepository(Generic[T], ABC):
 		"""Get all entities with pagination"""
 		pass
 
+	@abstractmethod
+	async def get_all_with_total(
+		self, skip: int = 0, limit: int = 10
+	) -> Tuple[List[T], int]:
+		"""Get a page of entities together with the total count"""
+		pass
+
 	@abstractmethod
 	async def update(self, entity_id: UUID, entity_data: dict) -> Optional[T]:
 		"""Update an entity"""
@@ -5,12 +5,14 @@ and Dependency Inversion Principle (DIP)
 """
 
 import logging
-from datetime import UTC, datetime
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, delete, func, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.exceptions.user_exceptions import (
 	UserAlreadyExistsError,
@@ -21,6 +23,55 @@ from app.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Listing order, served by the (created_at, id) index scanned backwards
+_NEWEST_FIRST = (UserDB.created_at.desc(), UserDB.id.desc())
+
+# Forbid implicit lazy loads so relationships added later must be loaded
+# explicitly (e.g. selectinload) instead of issuing one query per row
+_NO_LAZY_LOADS = raiseload("*")
+
+# Fixed-shape statements built once; only the bound user_id changes per call,
+# so every execution is a hit in the compiled statement cache
+_GET_BY_ID = lambda_stmt(
+	lambda: (
+		select(UserDB)
+		.options(_NO_LAZY_LOADS)
+		.where(UserDB.id == bindparam("user_id"))
+	)
+)
+_DELETE_BY_ID = lambda_stmt(
+	lambda: (
+		delete(UserDB)
+		.where(UserDB.id == bindparam("user_id"))
+		.returning(UserDB.id)
+	)
+)
+
+# How a duplicate email is reported: PostgreSQL drivers name the unique
+# index backing users.email, SQLite names the column in its message
+_EMAIL_UNIQUE_INDEX = "ix_users_email"
+_SQLITE_EMAIL_CONFLICT = "UNIQUE constraint failed: users.email"
+
+
+def _is_email_conflict(error: IntegrityError) -> bool:
+	"""
+	Tell a duplicate email apart from other integrity violations
+
+	Args:
+		error: Integrity error raised by the database
+
+	Returns:
+		True if the unique email constraint was violated
+	"""
+	orig = error.orig
+	# psycopg exposes diagnostics, asyncpg chains its own exception
+	constraint = getattr(getattr(orig, "diag", None), "constraint_name", None)
+	if constraint is None:
+		constraint = getattr(orig.__cause__, "constraint_name", None)
+	if constraint is not None:
+		return constraint == _EMAIL_UNIQUE_INDEX
+	return _SQLITE_EMAIL_CONFLICT in str(orig)
+
 
 class UserRepository(BaseRepository[User]):
 	"""
@@ -54,24 +105,20 @@ class UserRepository(BaseRepository[User]):
 		Raises:
 			UserAlreadyExistsError: If user with email already exits
 		"""
-		# Check if user with email already exists
-		existing_user = await self._get_by_email(user_data.email)
-		if existing_user:
-			raise UserAlreadyExistsError(
-				f"User with email {user_data.email} already exists"
-			)
-
 		# Create database model
 		db_user = UserDB(
 			name=user_data.name,
 			email=user_data.email,
 		)
 
+		# The unique email constraint rejects duplicates in the INSERT itself.
+		# Timestamps are column defaults filled into the INSERT, so the
+		# flushed instance is complete without a refresh
 		self.session.add(db_user)
-		await self.session.flush()
-		await self.session.refresh(db_user)
+		with self._unique_email(user_data.email):
+			await self.session.flush()
 
-		logger.info(f"User created with ID: {db_user.id}")
+		logger.info("User created with ID: %s", db_user.id)
 
 		# Convert to Pydantic model
 		return self._to_pydantic(db_user)
@@ -86,15 +133,14 @@ class UserRepository(BaseRepository[User]):
 		Returns:
 			User if found, None otherwise
 		"""
-		stmt = select(UserDB).where(UserDB.id == str(user_id))
-		result = await self.session.execute(stmt)
+		result = await self.session.execute(_GET_BY_ID, {"user_id": user_id})
 		db_user = result.scalar_one_or_none()
 
 		if db_user:
-			logger.info(f"User found with ID: {user_id}")
+			logger.info("User found with ID: %s", user_id)
 			return self._to_pydantic(db_user)
 		else:
-			logger.warning(f"User not found with ID: {user_id}")
+			logger.warning("User not found with ID: %s", user_id)
 			return None
 
 	async def get_all(self, skip: int = 0, limit: int = 10) -> List[User]:
@@ -108,15 +154,80 @@ class UserRepository(BaseRepository[User]):
 		Returns:
 			List of users
 		"""
-		stmt = select(UserDB).offset(skip).limit(limit)
+		users = [user async for user in self.iter_all(skip, limit)]
+
+		logger.info(
+			"Retrieved %s users (skip: %s, limit: %s)", len(users), skip, limit
+		)
+
+		return users
+
+	async def iter_all(
+		self, skip: int = 0, limit: int = 10
+	) -> AsyncIterator[User]:
+		"""
+		Stream users with pagination
+
+		Rows are converted as they arrive from the cursor, so large pages
+		are never held as ORM objects and domain models at the same time
+
+		Args:
+			skip: Number of users to skip
+			limit: Maximum number of users to return
+
+		Yields:
+			Users in listing order
+		"""
+		stmt = (
+			select(UserDB)
+			.options(_NO_LAZY_LOADS)
+			.order_by(*_NEWEST_FIRST)
+			.offset(skip)
+			.limit(limit)
+		)
+		result = await self.session.stream_scalars(stmt)
+		async for db_user in result:
+			yield self._to_pydantic(db_user)
+
+	async def get_all_with_total(
+		self, skip: int = 0, limit: int = 10
+	) -> Tuple[List[User], int]:
+		"""
+		Get a page of users and the total count in a single query
+
+		Args:
+			skip: Number of users to skip
+			limit: Maximum number of users to return
+
+		Returns:
+			Tuple of (users list, total count)
+		"""
+		stmt = (
+			select(UserDB, func.count().over().label("total"))
+			.options(_NO_LAZY_LOADS)
+			.order_by(*_NEWEST_FIRST)
+			.offset(skip)
+			.limit(limit)
+		)
 		result = await self.session.execute(stmt)
-		db_users = result.scalars().all()
+		rows = result.all()
+
+		# An empty page carries no window count: an empty first page means
+		# an empty table, past the last page fall back to COUNT(*)
+		if rows:
+			total = rows[0].total
+		else:
+			total = await self.count() if skip else 0
 
 		logger.info(
-			f"Retrieved {len(db_users)} users (skip: {skip}, limit: {limit})"
+			"Retrieved %s of %s users (skip: %s, limit: %s)",
+			len(rows),
+			total,
+			skip,
+			limit,
 		)
 
-		return [self._to_pydantic(db_user) for db_user in db_users]
+		return [self._to_pydantic(row.UserDB) for row in rows], total
 
 	async def update(
 		self, user_id: UUID, user_data: UserUpdate
@@ -135,33 +246,25 @@ class UserRepository(BaseRepository[User]):
 			UserAlreadyExistsError: If email is being changed to an
 				existing email
 		"""
-		stmt = select(UserDB).where(UserDB.id == str(user_id))
-		result = await self.session.execute(stmt)
+		# updated_at is stamped by the column's onupdate
+		values = user_data.model_dump(exclude_unset=True)
+
+		# Single UPDATE ... RETURNING: no SELECT before or after the write
+		stmt = (
+			update(UserDB)
+			.where(UserDB.id == user_id)
+			.values(**values)
+			.returning(UserDB)
+		)
+		with self._unique_email(values.get("email")):
+			result = await self.session.execute(stmt)
 		db_user = result.scalar_one_or_none()
 
 		if not db_user:
-			logger.warning(f"User not found for update with ID: {user_id}")
+			logger.warning("User not found for update with ID: %s", user_id)
 			return None
 
-		updated_data = user_data.model_dump(exclude_unset=True)
-
-		# Check email uniqueness if email is being updated
-		if "email" in updated_data and updated_data["email"] != db_user.email:
-			existing_user = await self._get_by_email(updated_data["email"])
-			if existing_user and existing_user.id != user_id:
-				raise UserAlreadyExistsError(
-					f"User with email {updated_data['email']} already exists"
-				)
-
-		# Update fields
-		for field, value in updated_data.items():
-			setattr(db_user, field, value)
-
-		db_user.updated_at = datetime.now(UTC)
-		await self.session.flush()
-		await self.session.refresh(db_user)
-
-		logger.info(f"User updated with ID: {user_id}")
+		logger.info("User updated with ID: %s", user_id)
 		return self._to_pydantic(db_user)
 
 	async def delete(self, user_id: UUID) -> bool:
@@ -174,17 +277,15 @@ class UserRepository(BaseRepository[User]):
 		Returns:
 			True if user was deleted, False if not found
 		"""
-		stmt = select(UserDB).where(UserDB.id == str(user_id))
-		result = await self.session.execute(stmt)
-		db_user = result.scalar_one_or_none()
+		result = await self.session.execute(
+			_DELETE_BY_ID, {"user_id": user_id}
+		)
 
-		if db_user:
-			await self.session.delete(db_user)
-			await self.session.flush()
-			logger.info(f"User deleted with ID: {user_id}")
+		if result.scalar_one_or_none() is not None:
+			logger.info("User deleted with ID: %s", user_id)
 			return True
 
-		logger.warning(f"User not found for deletion with ID: {user_id}")
+		logger.warning("User not found for deletion with ID: %s", user_id)
 		return False
 
 	async def count(self) -> int:
@@ -198,26 +299,32 @@ class UserRepository(BaseRepository[User]):
 		result = await self.session.execute(stmt)
 		count = result.scalar_one()
 
-		logger.info(f"Total users count: {count}")
+		logger.info("Total users count: %s", count)
 		return count
 
-	async def _get_by_email(self, email: str) -> Optional[User]:
+	@contextmanager
+	def _unique_email(self, email: Optional[str]) -> Iterator[None]:
 		"""
-		Helper method to get user by email
+		Translate a unique email violation raised by the wrapped write
+
+		The failed statement leaves the session needing a rollback, which
+		the caller's unit of work (get_db) performs. Other integrity errors,
+		such as NOT NULL violations, propagate unchanged
 
 		Args:
-			email: User email
+			email: Email being written, if any
 
-		Returns:
-			User if found, None otherwise
+		Raises:
+			UserAlreadyExistsError: If another user already has the email
 		"""
-		stmt = select(UserDB).where(UserDB.email == email)
-		result = await self.session.execute(stmt)
-		db_user = result.scalar_one_or_none()
-
-		if db_user:
-			return self._to_pydantic(db_user)
-		return None
+		try:
+			yield
+		except IntegrityError as e:
+			if not _is_email_conflict(e):
+				raise
+			raise UserAlreadyExistsError(
+				f"User with email {email} already exists"
+			) from e
 
 	def _to_pydantic(self, db_user: UserDB) -> User:
 		"""
@@ -229,8 +336,9 @@ class UserRepository(BaseRepository[User]):
 		Returns:
 			Pydantic User instance
 		"""
-		return User(
-			id=UUID(db_user.id),
+		# Rows were validated on write, so skip re-validating them on read
+		return User.model_construct(
+			id=db_user.id,
 			name=db_user.name,
 			email=db_user.email,
 			created_at=db_user.created_at,
@@ -44,13 +44,13 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		Returns:
 			Created user
 		"""
-		logger.info(f"Creating user with email: {user_data.email}")
+		logger.info("Creating user with email: %s", user_data.email)
 
 		# Business logic: Additional validation could be added here
 		# For example: checking if name contains prohibited words, etc.
 
 		user = await self._user_repository.create(user_data)
-		logger.info(f"User created successfully: {user.id}")
+		logger.info("User created successfully: %s", user.id)
 		return user
 
 	async def get_by_id(self, user_id: UUID) -> User:
@@ -66,13 +66,13 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		Raises:
 			UserNotFoundError: If user is not found
 		"""
-		logger.info(f"Retrieving user with ID: {user_id}")
+		logger.info("Retrieving user with ID: %s", user_id)
 
 		user = await self._user_repository.get_by_id(user_id)
 		if not user:
 			raise UserNotFoundError(f"User with ID {user_id} not found")
 
-		logger.info(f"User retrieved successfully: {user_id}")
+		logger.info("User retrieved successfully: %s", user_id)
 		return user
 
 	async def get_all(
@@ -89,7 +89,9 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 			Tuple of (users list, total count)
 		"""
 		logger.info(
-			f"Retrieving users with pagination (skip: {skip}, limit: {limit})"
+			"Retrieving users with pagination (skip: %s, limit: %s)",
+			skip,
+			limit,
 		)
 
 		# Business logic: Validate pagination parameters
@@ -98,11 +100,12 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		if limit <= 0 or limit > max_limit:  # Max limit of 100
 			limit = 10
 
-		users = await self._user_repository.get_all(skip, limit)
-		total_count = await self._user_repository.count()
+		users, total_count = await self._user_repository.get_all_with_total(
+			skip, limit
+		)
 
 		logger.info(
-			f"Retrieving {len(users)} users out of {total_count} total"
+			"Retrieving %s users out of %s total", len(users), total_count
 		)
 		return users, total_count
 
@@ -120,20 +123,16 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		Raises:
 			UserNotFoundError: If user is not found
 		"""
-		logger.info(f"Updating user with ID: {user_id}")
-
-		# Business logic: Ensure user exists first
-		await self.get_by_id(
-			user_id
-		)  # This will raise UserNotFoundError if not found
+		logger.info("Updating user with ID: %s", user_id)
 
 		# Additional business logic validation could be added here
 
+		# The repository reports a missing user, so no existence pre-check
 		updated_user = await self._user_repository.update(user_id, user_data)
 		if not updated_user:
 			raise UserNotFoundError(f"User with ID {user_id} not found")
 
-		logger.info(f"User updated successfully: {user_id}")
+		logger.info("User updated successfully: %s", user_id)
 		return updated_user
 
 	async def delete(self, user_id: UUID) -> bool:
@@ -149,12 +148,7 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		Raises:
 			UserNotFoundError: If user is not found
 		"""
-		logger.info(f"Deleting user with ID: {user_id}")
-
-		# Business logic: Ensure user exists first
-		await self.get_by_id(
-			user_id
-		)  # This will raise UserNotFoundError if not found
+		logger.info("Deleting user with ID: %s", user_id)
 
 		# Additional business logic could be added here
 		# For example: checking if user has related data that needs cleanup
@@ -163,5 +157,5 @@ class UserService(BaseService[User, UserCreate, UserUpdate]):
 		if not deleted:
 			raise UserNotFoundError(f"User with ID {user_id} not found")
 
-		logger.info(f"User deleted successfully: {user_id}")
+		logger.info("User deleted successfully: %s", user_id)
 		return True
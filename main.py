@@ -2,13 +2,16 @@
 FastAPI CRUD API demonstrating SOLID principles
 """
 
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.controllers.user_controller import UserController
 from app.database import close_db, init_db
 from app.dependencies.container import Container
+from app.exceptions.handlers import register_exception_handlers
 
 
 @asynccontextmanager
@@ -20,7 +23,8 @@ async def lifespan(app: FastAPI):
 	# Startup: Initialize database
 	await init_db()
 	yield
-	# Shutdown: Close database connections
+	# Shutdown: Close cache and database connections
+	await app.state.container.cache().close()
 	await close_db()
 
 
@@ -36,16 +40,19 @@ def create_app() -> FastAPI:
 		),
 		version="1.0.0",
 		lifespan=lifespan,
+		default_response_class=ORJSONResponse,
 	)
 
 	# Initialize dependency container
 	container = Container()
+	app.state.container = container
+
+	# Map domain exceptions to HTTP responses in one place
+	register_exception_handlers(app)
 
 	# Include routers with dependency injection
 	user_controller = UserController(container)
-	app.include_router(
-		user_controller.router, prefix="/api/v1", tags=["users"]
-	)
+	app.include_router(user_controller.router, prefix="/api/v1")
 
 	return app
 
@@ -55,4 +62,11 @@ app = create_app()
 if __name__ == "__main__":
 	import uvicorn
 
-	uvicorn.run(app, host="0.0.0.0", port=8000)
+	# uvicorn[standard] brings uvloop and httptools, which uvicorn picks
+	# automatically; one worker process per core by default
+	uvicorn.run(
+		"main:app",
+		host="0.0.0.0",
+		port=8000,
+		workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+	)
@@ -1,101 +1,254 @@
-import asyncio
 from typing import AsyncGenerator, Generator
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from uuid import UUID, uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
 	AsyncSession,
 	async_sessionmaker,
 	create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_db
+from app.cache.null_cache import NullCache
+from app.database import Base, _set_sqlite_pragmas, get_db, get_read_db
 from app.dependencies.container import Container
+from app.models.db_models import UserDB
+from app.repositories.user_repository import UserRepository
+from app.services.user_service import UserService
 from main import create_app
+from tests.factories import NONEXISTENT_ID, UserDBFactory
+
+# Statements issued by the per-test transaction, not by the code under test
+_TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK")
 
 
 # Database fixtures
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-	"""Create an instance of the default event loop for the test session."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture
 async def test_db_engine():
-	"""Create a test database engine."""
-	# Use in-memory SQLite for tests
+	"""Create a test database engine with the schema built once."""
+	# A single shared connection keeps the in-memory database alive; it is
+	# private to the process, so each pytest-xdist worker gets its own
 	engine = create_async_engine(
 		"sqlite+aiosqlite:///:memory:",
 		echo=False,
 		future=True,
+		poolclass=StaticPool,
 	)
 
+	# Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite, and
+	# apply the production pragmas (WAL falls back to the in-memory journal)
+	@event.listens_for(engine.sync_engine, "connect")
+	def _configure_connection(dbapi_connection, connection_record):
+		dbapi_connection.isolation_level = None
+		_set_sqlite_pragmas(dbapi_connection, connection_record)
+
+	@event.listens_for(engine.sync_engine, "begin")
+	def _emit_begin(conn):
+		conn.exec_driver_sql("BEGIN")
+
 	async with engine.begin() as conn:
 		await conn.run_sync(Base.metadata.create_all)
 
 	yield engine
 
-	async with engine.begin() as conn:
-		await conn.run_sync(Base.metadata.drop_all)
-
 	await engine.dispose()
 
 
+@pytest.fixture(scope="class")
+async def test_db_connection(test_db_engine):
+	"""Open a connection whose transaction spans a whole test class."""
+	async with test_db_engine.connect() as conn:
+		transaction = await conn.begin()
+		yield conn
+		await transaction.rollback()
+
+
 @pytest.fixture
 async def test_db_session(
-	test_db_engine,
+	test_db_connection,
 ) -> AsyncGenerator[AsyncSession, None]:
-	"""Create a test database session."""
+	"""Create a test database session rolled back to a SAVEPOINT."""
+	# Data loaded by class-scoped fixtures lives in the outer transaction
+	# and survives; everything a test writes is undone with its SAVEPOINT
+	savepoint = await test_db_connection.begin_nested()
 	async_session = async_sessionmaker(
-		test_db_engine,
+		bind=test_db_connection,
 		class_=AsyncSession,
 		expire_on_commit=False,
 		autocommit=False,
 		autoflush=False,
+		join_transaction_mode="create_savepoint",
 	)
 
 	async with async_session() as session:
 		yield session
-		await session.rollback()
+
+	await savepoint.rollback()
+
+
+@pytest.fixture
+async def seeded_user(test_db_session) -> UserDB:
+	"""Insert a user directly into the test database."""
+	user = UserDBFactory()
+	test_db_session.add(user)
+	await test_db_session.flush()
+	return user
+
+
+@pytest.fixture
+def query_counter(test_db_engine) -> Generator[list[str], None, None]:
+	"""Record SQL statements run during a test, minus transaction control."""
+	statements: list[str] = []
+
+	def record(conn, cursor, statement, *args):
+		if not statement.startswith(_TRANSACTION_CONTROL):
+			statements.append(statement)
+
+	sync_engine = test_db_engine.sync_engine
+	event.listen(sync_engine, "before_cursor_execute", record)
+	yield statements
+	event.remove(sync_engine, "before_cursor_execute", record)
 
 
 # Application fixtures
+@pytest.fixture(scope="session")
+def test_app():
+	"""Create the FastAPI app once for the whole test session."""
+	return create_app()
+
+
+@pytest.fixture(scope="session")
+async def session_client(test_app) -> AsyncGenerator[AsyncClient, None]:
+	"""Create one async test client shared by every test."""
+	async with AsyncClient(
+		transport=ASGITransport(app=test_app), base_url="http://test"
+	) as ac:
+		yield ac
+
+
 @pytest.fixture
-def app_with_test_db(test_db_session):
-	"""Create FastAPI app with test database."""
-	app = create_app()
+def app_with_test_db(test_app, test_db_session):
+	"""Point the shared app at the current test's database session."""
 
 	async def override_get_db():
 		yield test_db_session
 
-	app.dependency_overrides[get_db] = override_get_db
+	test_app.dependency_overrides[get_db] = override_get_db
+	test_app.dependency_overrides[get_read_db] = override_get_db
 
-	yield app
+	yield test_app
 
-	app.dependency_overrides.clear()
+	test_app.dependency_overrides.clear()
 
 
 @pytest.fixture
-async def client(app_with_test_db) -> AsyncGenerator[AsyncClient, None]:
-	"""Create async test client."""
+def client(session_client, app_with_test_db) -> AsyncClient:
+	"""Async test client bound to the current test's database session."""
+	return session_client
+
+
+@pytest.fixture
+async def err_client(
+	test_app, monkeypatch
+) -> AsyncGenerator[AsyncClient, None]:
+	"""Async test client whose user service fails on every call."""
+	failing_service = AsyncMock(spec=UserService)
+	for method in ("create", "get_by_id", "get_all", "update", "delete"):
+		getattr(failing_service, method).side_effect = RuntimeError(
+			"Service failure"
+		)
+	monkeypatch.setattr(
+		test_app.state.container,
+		"user_service",
+		lambda session: failing_service,
+	)
+
+	# The failure happens before any query, so no database is needed
+	async def override_get_db():
+		yield None
+
+	test_app.dependency_overrides[get_db] = override_get_db
+	test_app.dependency_overrides[get_read_db] = override_get_db
+
+	# Starlette re-raises after the 500 handler has responded; keep the
+	# response instead of surfacing the exception in the test
 	async with AsyncClient(
-		transport=ASGITransport(app=app_with_test_db), base_url="http://test"
+		transport=ASGITransport(app=test_app, raise_app_exceptions=False),
+		base_url="http://test",
 	) as ac:
 		yield ac
 
+	test_app.dependency_overrides.clear()
 
-# Container fixtures
+
+# Service fixtures
 @pytest.fixture
+def user_service(test_db_session) -> UserService:
+	"""Create a user service backed by the test database session."""
+	return UserService(UserRepository(test_db_session))
+
+
+# Container fixtures
+@pytest.fixture(scope="session")
 def container():
-	"""Create dependency injection container."""
+	"""Create one dependency injection container for the test session."""
 	return Container()
 
 
 # Mock fixtures
+# Spec'd once at import; the fixture only resets it between tests
+_USER_SERVICE_PROTOTYPE = create_autospec(
+	UserService, instance=True, spec_set=True
+)
+
+
+class _StubContainer:
+	"""Stand-in for Container exposing only what controllers resolve."""
+
+	# Slots reject attributes Container does not have, like spec= would,
+	# without introspecting Container for every test
+	__slots__ = ("cache", "user_service")
+
+	def __init__(self, user_service):
+		self.cache = MagicMock(return_value=NullCache())
+		self.user_service = MagicMock(return_value=user_service)
+
+
+@pytest.fixture
+def mock_user_service():
+	"""Autospec'd UserService mock with no configured results or calls."""
+	_USER_SERVICE_PROTOTYPE.reset_mock(return_value=True, side_effect=True)
+	return _USER_SERVICE_PROTOTYPE
+
+
+@pytest.fixture
+def mock_container(mock_user_service) -> _StubContainer:
+	"""Stub container serving mock_user_service and no cache."""
+	return _StubContainer(mock_user_service)
+
+
+@pytest.fixture
+def mock_async_session_factory():
+	"""Build session factory mocks whose context manager yields a session."""
+
+	def make(session) -> MagicMock:
+		context = AsyncMock()
+		context.__aenter__.return_value = session
+		context.__aexit__.return_value = None
+		return MagicMock(return_value=context)
+
+	return make
+
+
+@pytest.fixture
+def nonexistent_id() -> UUID:
+	"""User ID guaranteed not to match any stored user."""
+	return NONEXISTENT_ID
+
+
 @pytest.fixture
 def mock_user_id():
 	"""Generate a mock user ID."""
@@ -6,6 +6,8 @@ Following AAA (Arrange-Act-Assert) pattern
 import pytest
 from httpx import AsyncClient
 
+from tests.helpers import insert_users
+
 
 @pytest.mark.e2e
 class TestUserEndpointsCreate:
@@ -88,18 +90,16 @@ class TestUserEndpointsCreate:
 class TestUserEndpointsGet:
 	"""Test GET /api/v1/users endpoints."""
 
-	async def test_get_user_by_id_success(self, client: AsyncClient):
+	async def test_get_user_by_id_success(
+		self, client: AsyncClient, seeded_user
+	):
 		"""
 		GIVEN an existing user
 		WHEN getting user by id
 		THEN user data is returned with 200 status
 		"""
-		# Arrange - create user first
-		create_payload = {"name": "Jane Doe", "email": "jane.doe@example.com"}
-		create_response = await client.post(
-			"/api/v1/users", json=create_payload
-		)
-		user_id = create_response.json()["id"]
+		# Arrange
+		user_id = str(seeded_user.id)
 
 		# Act
 		response = await client.get(f"/api/v1/users/{user_id}")
@@ -108,20 +108,19 @@ class TestUserEndpointsGet:
 		assert response.status_code == 200
 		data = response.json()
 		assert data["id"] == user_id
-		assert data["name"] == "Jane Doe"
-		assert data["email"] == "jane.doe@example.com"
+		assert data["name"] == seeded_user.name
+		assert data["email"] == seeded_user.email
 
-	async def test_get_user_by_id_not_found(self, client: AsyncClient):
+	async def test_get_user_by_id_not_found(
+		self, client: AsyncClient, nonexistent_id
+	):
 		"""
 		GIVEN a non-existent user id
 		WHEN getting user by id
 		THEN 404 not found is returned
 		"""
-		# Arrange
-		non_existent_id = "00000000-0000-0000-0000-000000000000"
-
 		# Act
-		response = await client.get(f"/api/v1/users/{non_existent_id}")
+		response = await client.get(f"/api/v1/users/{nonexistent_id}")
 
 		# Assert
 		assert response.status_code == 404
@@ -145,16 +144,22 @@ class TestUserEndpointsGet:
 		assert data["page"] == 1
 		assert data["per_page"] == 10
 
-	async def test_get_all_users_with_data(self, client: AsyncClient):
+	async def test_get_all_users_with_data(
+		self, client: AsyncClient, test_db_session
+	):
 		"""
 		GIVEN multiple users in database
 		WHEN getting all users
 		THEN users list is returned with correct pagination
 		"""
 		# Arrange - create 3 users
-		for i in range(3):
-			payload = {"name": f"User {i}", "email": f"user{i}@example.com"}
-			await client.post("/api/v1/users", json=payload)
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(3)
+			],
+		)
 
 		# Act
 		response = await client.get("/api/v1/users")
@@ -168,19 +173,22 @@ class TestUserEndpointsGet:
 		assert data["per_page"] == 10
 		assert data["total_pages"] == 1
 
-	async def test_get_all_users_with_pagination(self, client: AsyncClient):
+	async def test_get_all_users_with_pagination(
+		self, client: AsyncClient, test_db_session
+	):
 		"""
 		GIVEN multiple users in database
 		WHEN getting users with pagination parameters
 		THEN correct page is returned
 		"""
 		# Arrange - create 15 users
-		for i in range(15):
-			payload = {
-				"name": f"User {i}",
-				"email": f"paginated{i}@example.com",
-			}
-			await client.post("/api/v1/users", json=payload)
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"paginated{i}@example.com"}
+				for i in range(15)
+			],
+		)
 
 		# Act
 		response = await client.get("/api/v1/users?page=2&per_page=5")
@@ -199,21 +207,14 @@ class TestUserEndpointsGet:
 class TestUserEndpointsUpdate:
 	"""Test PUT /api/v1/users/{user_id} endpoint."""
 
-	async def test_update_user_success(self, client: AsyncClient):
+	async def test_update_user_success(self, client: AsyncClient, seeded_user):
 		"""
 		GIVEN an existing user
 		WHEN updating user data
 		THEN user is updated and 200 status is returned
 		"""
-		# Arrange - create user first
-		create_payload = {
-			"name": "Original Name",
-			"email": "original@example.com",
-		}
-		create_response = await client.post(
-			"/api/v1/users", json=create_payload
-		)
-		user_id = create_response.json()["id"]
+		# Arrange
+		user_id = str(seeded_user.id)
 
 		update_payload = {
 			"name": "Updated Name",
@@ -232,21 +233,15 @@ class TestUserEndpointsUpdate:
 		assert data["name"] == "Updated Name"
 		assert data["email"] == "updated@example.com"
 
-	async def test_update_user_partial(self, client: AsyncClient):
+	async def test_update_user_partial(self, client: AsyncClient, seeded_user):
 		"""
 		GIVEN an existing user
 		WHEN updating only some fields
 		THEN only specified fields are updated
 		"""
 		# Arrange
-		create_payload = {
-			"name": "Original Name",
-			"email": "original@example.com",
-		}
-		create_response = await client.post(
-			"/api/v1/users", json=create_payload
-		)
-		user_id = create_response.json()["id"]
+		user_id = str(seeded_user.id)
+		original_email = seeded_user.email
 
 		update_payload = {
 			"name": "New Name"
@@ -262,21 +257,22 @@ class TestUserEndpointsUpdate:
 		assert response.status_code == 200
 		data = response.json()
 		assert data["name"] == "New Name"
-		assert data["email"] == "original@example.com"  # unchanged
+		assert data["email"] == original_email  # unchanged
 
-	async def test_update_user_not_found(self, client: AsyncClient):
+	async def test_update_user_not_found(
+		self, client: AsyncClient, nonexistent_id
+	):
 		"""
 		GIVEN a non-existent user id
 		WHEN updating user
 		THEN 404 not found is returned
 		"""
 		# Arrange
-		non_existent_id = "00000000-0000-0000-0000-000000000000"
 		update_payload = {"name": "New Name"}
 
 		# Act
 		response = await client.put(
-			f"/api/v1/users/{non_existent_id}", json=update_payload
+			f"/api/v1/users/{nonexistent_id}", json=update_payload
 		)
 
 		# Assert
@@ -287,18 +283,14 @@ class TestUserEndpointsUpdate:
 class TestUserEndpointsDelete:
 	"""Test DELETE /api/v1/users/{user_id} endpoint."""
 
-	async def test_delete_user_success(self, client: AsyncClient):
+	async def test_delete_user_success(self, client: AsyncClient, seeded_user):
 		"""
 		GIVEN an existing user
 		WHEN deleting the user
 		THEN 204 no content is returned
 		"""
-		# Arrange - create user first
-		create_payload = {"name": "To Delete", "email": "delete@example.com"}
-		create_response = await client.post(
-			"/api/v1/users", json=create_payload
-		)
-		user_id = create_response.json()["id"]
+		# Arrange
+		user_id = seeded_user.id
 
 		# Act
 		response = await client.delete(f"/api/v1/users/{user_id}")
@@ -310,17 +302,16 @@ class TestUserEndpointsDelete:
 		get_response = await client.get(f"/api/v1/users/{user_id}")
 		assert get_response.status_code == 404
 
-	async def test_delete_user_not_found(self, client: AsyncClient):
+	async def test_delete_user_not_found(
+		self, client: AsyncClient, nonexistent_id
+	):
 		"""
 		GIVEN a non-existent user id
 		WHEN deleting user
 		THEN 404 not found is returned
 		"""
-		# Arrange
-		non_existent_id = "00000000-0000-0000-0000-000000000000"
-
 		# Act
-		response = await client.delete(f"/api/v1/users/{non_existent_id}")
+		response = await client.delete(f"/api/v1/users/{nonexistent_id}")
 
 		# Assert
 		assert response.status_code == 404
@@ -352,9 +343,10 @@ class TestUserEndpointsCompleteFlow:
 		# Assert 1: User created
 		assert create_response.status_code == 201
 		user_id = create_response.json()["id"]
+		user_url = f"/api/v1/users/{user_id}"
 
 		# Act 2: Get user
-		get_response = await client.get(f"/api/v1/users/{user_id}")
+		get_response = await client.get(user_url)
 
 		# Assert 2: User retrieved
 		assert get_response.status_code == 200
@@ -362,7 +354,7 @@ class TestUserEndpointsCompleteFlow:
 
 		# Act 3: Update user
 		update_response = await client.put(
-			f"/api/v1/users/{user_id}", json={"name": "Updated Lifecycle"}
+			user_url, json={"name": "Updated Lifecycle"}
 		)
 
 		# Assert 3: User updated
@@ -377,15 +369,91 @@ class TestUserEndpointsCompleteFlow:
 		assert list_response.json()["total"] == initial_count + 1
 
 		# Act 5: Delete user
-		delete_response = await client.delete(f"/api/v1/users/{user_id}")
+		delete_response = await client.delete(user_url)
 
 		# Assert 5: User deleted
 		assert delete_response.status_code == 204
 
 		# Act 6: Verify deletion
-		final_get = await client.get(f"/api/v1/users/{user_id}")
+		final_get = await client.get(user_url)
 		final_list = await client.get("/api/v1/users")
 
 		# Assert 6: User gone
 		assert final_get.status_code == 404
 		assert final_list.json()["total"] == initial_count
+
+
+@pytest.mark.e2e
+class TestUserEndpointsQueryCount:
+	"""Test the number of SQL statements issued per endpoint."""
+
+	async def test_get_user_by_id_single_query(
+		self, client: AsyncClient, seeded_user, query_counter
+	):
+		"""
+		GIVEN an existing user
+		WHEN getting the user by id
+		THEN a single SELECT is issued
+		"""
+		# Arrange
+		user_id = seeded_user.id
+		query_counter.clear()
+
+		# Act
+		response = await client.get(f"/api/v1/users/{user_id}")
+
+		# Assert
+		assert response.status_code == 200
+		assert len(query_counter) == 1
+
+	async def test_get_all_users_single_query(
+		self, client: AsyncClient, test_db_session, query_counter
+	):
+		"""
+		GIVEN several users
+		WHEN listing users
+		THEN page and total come from a single SELECT
+		"""
+		# Arrange
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(3)
+			],
+		)
+		query_counter.clear()
+
+		# Act
+		response = await client.get("/api/v1/users?page=1&per_page=2")
+
+		# Assert
+		assert response.status_code == 200
+		assert response.json()["total"] == 3
+		assert len(query_counter) == 1
+
+	async def test_update_and_delete_single_statement(
+		self, client: AsyncClient, seeded_user, query_counter
+	):
+		"""
+		GIVEN an existing user
+		WHEN updating and then deleting the user
+		THEN each request issues a single statement
+		"""
+		# Arrange
+		user_id = seeded_user.id
+		query_counter.clear()
+
+		# Act
+		updated = await client.put(
+			f"/api/v1/users/{user_id}", json={"name": "Jane Doe"}
+		)
+		update_queries = len(query_counter)
+		query_counter.clear()
+		deleted = await client.delete(f"/api/v1/users/{user_id}")
+
+		# Assert
+		assert updated.status_code == 200
+		assert deleted.status_code == 204
+		assert update_queries == 1
+		assert len(query_counter) == 1
@@ -3,7 +3,7 @@ Factory Boy factories for test data generation
 """
 
 from datetime import UTC, datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import factory
 from factory import LazyFunction
@@ -11,6 +11,23 @@ from factory import LazyFunction
 from app.models.db_models import UserDB
 from app.models.user import User, UserCreate, UserUpdate
 
+# The nil UUID is never produced by uuid4, so no stored user can have it
+NONEXISTENT_ID = UUID(int=0)
+
+# Deterministic identity for tests that never compare users with each other
+_FIXED_ID = UUID(int=1)
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _unique_name() -> str:
+	"""Build a unique user name without going through Faker."""
+	return f"User {uuid4().hex[:8]}"
+
+
+def _unique_email() -> str:
+	"""Build a unique email address without going through Faker."""
+	return f"user_{uuid4().hex[:8]}@example.com"
+
 
 class UserDBFactory(factory.Factory):
 	"""Factory for UserDB SQLAlchemy model."""
@@ -18,11 +35,12 @@ class UserDBFactory(factory.Factory):
 	class Meta:
 		model = UserDB
 
-	id = LazyFunction(lambda: str(uuid4()))
-	name = factory.Faker("name")
-	email = factory.Faker("email")
+	id = LazyFunction(uuid4)
+	name = LazyFunction(_unique_name)
+	email = LazyFunction(_unique_email)
 	created_at = LazyFunction(lambda: datetime.now(UTC))
-	updated_at = LazyFunction(lambda: datetime.now(UTC))
+	# A fresh row has never been updated: reuse the creation timestamp
+	updated_at = factory.SelfAttribute("created_at")
 
 
 class UserFactory(factory.Factory):
@@ -32,10 +50,11 @@ class UserFactory(factory.Factory):
 		model = User
 
 	id = LazyFunction(uuid4)
-	name = factory.Faker("name")
-	email = factory.Faker("email")
+	name = LazyFunction(_unique_name)
+	email = LazyFunction(_unique_email)
 	created_at = LazyFunction(lambda: datetime.now(UTC))
-	updated_at = LazyFunction(lambda: datetime.now(UTC))
+	# A fresh row has never been updated: reuse the creation timestamp
+	updated_at = factory.SelfAttribute("created_at")
 
 
 class UserCreateFactory(factory.Factory):
@@ -44,8 +63,8 @@ class UserCreateFactory(factory.Factory):
 	class Meta:
 		model = UserCreate
 
-	name = factory.Faker("name")
-	email = factory.Faker("email")
+	name = LazyFunction(_unique_name)
+	email = LazyFunction(_unique_email)
 
 
 class UserUpdateFactory(factory.Factory):
@@ -54,21 +73,52 @@ class UserUpdateFactory(factory.Factory):
 	class Meta:
 		model = UserUpdate
 
-	name = factory.Faker("name")
-	email = factory.Faker("email")
+	name = LazyFunction(_unique_name)
+	email = LazyFunction(_unique_email)
+
+
+# Helper functions for common test scenarios; they build models directly,
+# skipping factory_boy's declaration resolution on every call
+def _with_defaults(kwargs: dict) -> dict:
+	"""Fill in a unique name and email unless they were overridden."""
+	if "name" not in kwargs:
+		kwargs["name"] = _unique_name()
+	if "email" not in kwargs:
+		kwargs["email"] = _unique_email()
+	return kwargs
+
+
+def _with_identity(kwargs: dict) -> dict:
+	"""Fill in id and timestamps, plus name and email, unless overridden."""
+	if "id" not in kwargs:
+		kwargs["id"] = uuid4()
+	if "created_at" not in kwargs or "updated_at" not in kwargs:
+		now = datetime.now(UTC)
+		kwargs.setdefault("created_at", now)
+		kwargs.setdefault("updated_at", now)
+	return _with_defaults(kwargs)
 
 
-# Helper functions for common test scenarios
 def create_user_data(**kwargs) -> UserCreate:
 	"""Create UserCreate instance with optional overrides."""
-	return UserCreateFactory(**kwargs)
+	return UserCreate(**_with_defaults(kwargs))
 
 
 def create_user(**kwargs) -> User:
 	"""Create User instance with optional overrides."""
-	return UserFactory(**kwargs)
+	return User(**_with_identity(kwargs))
 
 
 def create_user_db(**kwargs) -> UserDB:
 	"""Create UserDB instance with optional overrides."""
-	return UserFactory(**kwargs)
+	return UserDB(**_with_identity(kwargs))
+
+
+def create_fake_user(**kwargs) -> User:
+	"""Create User instance with a fixed id, timestamps, name and email."""
+	kwargs.setdefault("id", _FIXED_ID)
+	kwargs.setdefault("name", "Test User")
+	kwargs.setdefault("email", "test.user@example.com")
+	kwargs.setdefault("created_at", _FIXED_NOW)
+	kwargs.setdefault("updated_at", _FIXED_NOW)
+	return User(**kwargs)
@@ -4,12 +4,19 @@ Utilities to make testing easier and more consistent
 """
 
 import asyncio
-from typing import Callable, List
-from uuid import UUID
+import os
+from operator import itemgetter
+from time import perf_counter_ns
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.user import UserCreate
+from app.models.db_models import UserDB
+from app.models.user import User, UserCreate, UserUpdate
+from app.repositories.base import BaseRepository
 
 
 async def create_multiple_users(
@@ -38,18 +45,26 @@ async def create_multiple_users(
 	return users
 
 
-async def cleanup_users(
-	client: AsyncClient, user_ids: List[UUID | str]
-) -> None:
+async def insert_users(
+	session: AsyncSession, users_data: List[dict]
+) -> List[UUID]:
 	"""
-	Helper to cleanup multiple users.
+	Insert multiple users straight into the database.
+
+	All rows go out in a single INSERT, for tests that only need users to
+	exist and are not exercising the create endpoint.
 
 	Args:
-		client: HTTP client
-		user_ids: List of user IDs to delete
+		session: Database session
+		users_data: List of user data dictionaries
+
+	Returns:
+		List of created user IDs
 	"""
-	for user_id in user_ids:
-		await client.delete(f"/api/v1/users/{user_id}")
+	result = await session.scalars(
+		insert(UserDB).returning(UserDB.id), users_data
+	)
+	return result.all()
 
 
 async def wait_for_condition(
@@ -60,23 +75,32 @@ async def wait_for_condition(
 	"""
 	Wait for a condition to become true.
 
+	Polls with exponential backoff starting at 1ms, so a condition that
+	holds almost immediately is seen without sleeping a full interval.
+
 	Args:
 		condition: Function that returns bool
 		timeout: Maximum time to wait in seconds
-		interval: Check interval in seconds
+		interval: Longest delay between checks in seconds
 
 	Returns:
 		True if condition met, False if timeout
 	"""
 	elapsed = 0.0
+	delay = min(0.001, interval)
 	while elapsed < timeout:
 		if condition():
 			return True
-		await asyncio.sleep(interval)
-		elapsed += interval
+		await asyncio.sleep(delay)
+		elapsed += delay
+		delay = min(delay * 2, interval)
 	return False
 
 
+# Pulls both user fields out of a response dict in one call
+_name_and_email = itemgetter("name", "email")
+
+
 def assert_user_data_matches(
 	actual: dict, expected: UserCreate, check_id: bool = True
 ) -> None:
@@ -88,8 +112,7 @@ def assert_user_data_matches(
 		expected: Expected UserCreate data
 		check_id: Whether to check for ID presence
 	"""
-	assert actual["name"] == expected.name
-	assert actual["email"] == expected.email
+	assert _name_and_email(actual) == (expected.name, expected.email)
 
 	if check_id:
 		assert "id" in actual
@@ -118,12 +141,8 @@ def assert_pagination_data(
 	assert data["page"] == expected_page
 	assert data["per_page"] == expected_per_page
 
-	# Calculate expected total_pages
-	expected_total_pages = (
-		(expected_total + expected_per_page - 1) // expected_per_page
-		if expected_total > 0
-		else 1
-	)
+	# Ceiling division; an empty result still reports one page
+	expected_total_pages = -(-expected_total // expected_per_page) or 1
 	assert data["total_pages"] == expected_total_pages
 
 
@@ -182,8 +201,6 @@ def generate_test_email(prefix: str = "test") -> str:
 	Returns:
 		Unique email address
 	"""
-	from uuid import uuid4
-
 	return f"{prefix}_{uuid4().hex[:8]}@example.com"
 
 
@@ -197,10 +214,12 @@ def generate_test_users_data(count: int) -> List[dict]:
 	Returns:
 		List of user data dictionaries
 	"""
+	# One urandom read for the whole batch instead of a uuid4() per user
+	suffixes = os.urandom(4 * count).hex()
 	return [
 		{
 			"name": f"Test User {i}",
-			"email": generate_test_email(f"user{i}"),
+			"email": f"user{i}_{suffixes[i * 8 : i * 8 + 8]}@example.com",
 		}
 		for i in range(count)
 	]
@@ -242,10 +261,70 @@ class TestDataBuilder:
 		return self
 
 
+class FakeUserRepository(BaseRepository[User]):
+	"""
+	In-memory repository double for service tests.
+
+	Each method returns the matching ``<method>_return`` attribute and
+	records its positional arguments in ``<method>_calls``.
+	"""
+
+	def __init__(self):
+		self.create_return: Optional[User] = None
+		self.get_by_id_return: Optional[User] = None
+		self.get_all_return: List[User] = []
+		self.get_all_with_total_return: Tuple[List[User], int] = ([], 0)
+		self.update_return: Optional[User] = None
+		self.delete_return = False
+		self.count_return = 0
+		self.create_calls: List[tuple] = []
+		self.get_by_id_calls: List[tuple] = []
+		self.get_all_calls: List[tuple] = []
+		self.get_all_with_total_calls: List[tuple] = []
+		self.update_calls: List[tuple] = []
+		self.delete_calls: List[tuple] = []
+		self.count_calls: List[tuple] = []
+
+	async def create(self, user_data: UserCreate) -> Optional[User]:
+		self.create_calls.append((user_data,))
+		return self.create_return
+
+	async def get_by_id(self, user_id: UUID) -> Optional[User]:
+		self.get_by_id_calls.append((user_id,))
+		return self.get_by_id_return
+
+	async def get_all(self, skip: int = 0, limit: int = 10) -> List[User]:
+		self.get_all_calls.append((skip, limit))
+		return self.get_all_return
+
+	async def get_all_with_total(
+		self, skip: int = 0, limit: int = 10
+	) -> Tuple[List[User], int]:
+		self.get_all_with_total_calls.append((skip, limit))
+		return self.get_all_with_total_return
+
+	async def update(
+		self, user_id: UUID, user_data: UserUpdate
+	) -> Optional[User]:
+		self.update_calls.append((user_id, user_data))
+		return self.update_return
+
+	async def delete(self, user_id: UUID) -> bool:
+		self.delete_calls.append((user_id,))
+		return self.delete_return
+
+	async def count(self) -> int:
+		self.count_calls.append(())
+		return self.count_return
+
+
 class AsyncTestTimer:
 	"""
 	Context manager for timing async operations in tests.
 
+	Uses the monotonic perf counter: start_time and end_time are in
+	nanoseconds, elapsed is in seconds.
+
 	Example:
 		async with AsyncTestTimer() as timer:
 			await some_operation()
@@ -258,16 +337,12 @@ class AsyncTestTimer:
 		self.elapsed = None
 
 	async def __aenter__(self):
-		import time
-
-		self.start_time = time.time()
+		self.start_time = perf_counter_ns()
 		return self
 
 	async def __aexit__(self, exc_type, exc_val, exc_tb):
-		import time
-
-		self.end_time = time.time()
-		self.elapsed = self.end_time - self.start_time
+		self.end_time = perf_counter_ns()
+		self.elapsed = (self.end_time - self.start_time) / 1e9
 		return False
 
 
@@ -300,10 +375,15 @@ def dict_contains(superset: dict, subset: dict) -> bool:
 	Returns:
 		True if superset contains subset
 	"""
-	return all(
-		key in superset and superset[key] == value
-		for key, value in subset.items()
-	)
+	if not subset:
+		return True
+	if not subset.keys() <= superset.keys():
+		return False
+	# itemgetter returns a bare value rather than a 1-tuple for one key
+	values = itemgetter(*subset)(superset)
+	if len(subset) == 1:
+		values = (values,)
+	return values == tuple(subset.values())
 
 
 def assert_dict_contains(superset: dict, subset: dict) -> None:
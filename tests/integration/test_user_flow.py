@@ -5,30 +5,26 @@ Following AAA (Arrange-Act-Assert) pattern
 
 import pytest
 
-from app.repositories.user_repository import UserRepository
-from app.services.user_service import UserService
+from app.models.user import UserUpdate
 from tests.factories import create_user_data
+from tests.helpers import insert_users
 
 
 @pytest.mark.integration
 class TestUserRepositoryServiceIntegration:
 	"""Test integration between repository and service with real database."""
 
-	async def test_complete_user_crud_flow(self, test_db_session):
+	async def test_complete_user_crud_flow(self, user_service):
 		"""
 		GIVEN a repository and service with real database
 		WHEN performing complete CRUD operations
 		THEN all operations work correctly end-to-end
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-		service = UserService(repository)
-
 		# Act 1: Create user
 		user_data = create_user_data(
 			name="Integration Test User", email="integration@test.com"
 		)
-		created_user = await service.create(user_data)
+		created_user = await user_service.create(user_data)
 
 		# Assert 1: User created
 		assert created_user.id is not None
@@ -36,24 +32,22 @@ class TestUserRepositoryServiceIntegration:
 		assert created_user.email == "integration@test.com"
 
 		# Act 2: Get user by id
-		retrieved_user = await service.get_by_id(created_user.id)
+		retrieved_user = await user_service.get_by_id(created_user.id)
 
 		# Assert 2: User retrieved
 		assert retrieved_user.id == created_user.id
 		assert retrieved_user.email == created_user.email
 
 		# Act 3: Update user
-		from app.models.user import UserUpdate
-
 		update_data = UserUpdate(name="Updated Name")
-		updated_user = await service.update(created_user.id, update_data)
+		updated_user = await user_service.update(created_user.id, update_data)
 
 		# Assert 3: User updated
 		assert updated_user.name == "Updated Name"
 		assert updated_user.email == "integration@test.com"
 
 		# Act 4: Get all users
-		all_users, count = await service.get_all()
+		all_users, count = await user_service.get_all()
 
 		# Assert 4: User in list
 		assert count == 1
@@ -61,50 +55,50 @@ class TestUserRepositoryServiceIntegration:
 		assert all_users[0].id == created_user.id
 
 		# Act 5: Delete user
-		delete_result = await service.delete(created_user.id)
+		delete_result = await user_service.delete(created_user.id)
 
 		# Assert 5: User deleted
 		assert delete_result is True
 
 		# Act 6: Verify deletion
-		all_users_after_delete, count_after = await service.get_all()
+		all_users_after_delete, count_after = await user_service.get_all()
 
 		# Assert 6: No users remain
 		assert count_after == 0
 		assert len(all_users_after_delete) == 0
 
-	async def test_multiple_users_with_pagination(self, test_db_session):
+	async def test_multiple_users_with_pagination(
+		self, user_service, test_db_session
+	):
 		"""
 		GIVEN multiple users in database
 		WHEN retrieving users with pagination
 		THEN correct pagination results are returned
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-		service = UserService(repository)
-
-		# Create 15 users
-		created_users = []
-		for i in range(15):
-			user_data = create_user_data(email=f"user{i}@test.com")
-			user = await service.create(user_data)
-			created_users.append(user)
+		# Arrange - create 15 users in one INSERT
+		created_ids = await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@test.com"}
+				for i in range(15)
+			],
+		)
 
 		# Act 1: Get first page
-		page_1, total = await service.get_all(skip=0, limit=5)
+		page_1, total = await user_service.get_all(skip=0, limit=5)
 
 		# Assert 1: First page correct
 		assert len(page_1) == 5
 		assert total == 15
 
 		# Act 2: Get second page
-		page_2, _ = await service.get_all(skip=5, limit=5)
+		page_2, _ = await user_service.get_all(skip=5, limit=5)
 
 		# Assert 2: Second page correct
 		assert len(page_2) == 5
 
 		# Act 3: Get last page
-		page_3, _ = await service.get_all(skip=10, limit=5)
+		page_3, _ = await user_service.get_all(skip=10, limit=5)
 
 		# Assert 3: Last page correct
 		assert len(page_3) == 5
@@ -112,22 +106,19 @@ class TestUserRepositoryServiceIntegration:
 		# Verify no duplicates across pages
 		all_ids = [u.id for u in page_1 + page_2 + page_3]
 		assert len(all_ids) == len(set(all_ids))
+		assert set(all_ids) == set(created_ids)
 
-	async def test_sequential_user_creation(self, test_db_session):
+	async def test_sequential_user_creation(self, user_service):
 		"""
 		GIVEN multiple user creation requests
 		WHEN creating users sequentially
 		THEN all users are created without conflicts
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-		service = UserService(repository)
-
 		# Act: Create users sequentially
 		results = []
 		for i in range(5):
 			user_data = create_user_data(email=f"sequential{i}@test.com")
-			user = await service.create(user_data)
+			user = await user_service.create(user_data)
 			results.append(user)
 
 		# Assert: All users created
@@ -135,7 +126,7 @@ class TestUserRepositoryServiceIntegration:
 		assert all(user.id is not None for user in results)
 
 		# Verify count
-		all_users, count = await service.get_all()
+		all_users, count = await user_service.get_all()
 		assert count == 5
 
 		# Verify all emails are unique
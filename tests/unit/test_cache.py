@@ -0,0 +1,209 @@
+"""
+Unit tests for cache implementations
+Following AAA (Arrange-Act-Assert) pattern
+"""
+
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.cache.null_cache import NullCache
+from app.cache.redis_cache import RedisCache
+
+
+@pytest.mark.unit
+class TestNullCache:
+	"""Test NullCache no-op behaviour."""
+
+	async def test_get_always_misses(self):
+		"""
+		GIVEN a value stored in a NullCache
+		WHEN getting the value back
+		THEN None is returned
+		"""
+		# Arrange
+		cache = NullCache()
+		await cache.set("key", "value", 30)
+
+		# Act
+		value = await cache.get("key")
+
+		# Assert
+		assert value is None
+
+	async def test_get_many_misses_every_key(self):
+		"""
+		GIVEN a NullCache
+		WHEN getting several keys at once
+		THEN None is returned for each key
+		"""
+		# Arrange
+		cache = NullCache()
+
+		# Act
+		values = await cache.get_many("a", "b")
+
+		# Assert
+		assert values == [None, None]
+
+	async def test_incr_returns_zero(self):
+		"""
+		GIVEN a NullCache
+		WHEN incrementing a counter
+		THEN 0 is returned
+		"""
+		# Arrange
+		cache = NullCache()
+
+		# Act
+		value = await cache.incr("counter")
+
+		# Assert
+		assert value == 0
+
+
+@pytest.mark.unit
+class TestRedisCache:
+	"""Test RedisCache delegation to the Redis client."""
+
+	async def test_get_delegates_to_client(self):
+		"""
+		GIVEN a Redis client holding a value
+		WHEN getting the value
+		THEN the client's value is returned
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		mock_client.get.return_value = b"value"
+		cache = RedisCache(mock_client)
+
+		# Act
+		value = await cache.get("key")
+
+		# Assert
+		assert value == b"value"
+		mock_client.get.assert_called_once_with("key")
+
+	async def test_get_many_uses_single_mget(self):
+		"""
+		GIVEN a Redis client
+		WHEN getting several keys at once
+		THEN a single MGET is issued
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		mock_client.mget.return_value = [b"1", None]
+		cache = RedisCache(mock_client)
+
+		# Act
+		values = await cache.get_many("a", "b")
+
+		# Assert
+		assert values == [b"1", None]
+		mock_client.mget.assert_called_once_with(("a", "b"))
+
+	async def test_set_uses_expiration(self):
+		"""
+		GIVEN a Redis client
+		WHEN setting a value with a ttl
+		THEN the value is stored with an expiration
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		cache = RedisCache(mock_client)
+
+		# Act
+		await cache.set("key", "value", 30)
+
+		# Assert
+		mock_client.set.assert_called_once_with("key", "value", ex=30)
+
+	async def test_delete_skips_empty_keys(self):
+		"""
+		GIVEN a Redis client
+		WHEN deleting without keys
+		THEN the client is not called
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		cache = RedisCache(mock_client)
+
+		# Act
+		await cache.delete()
+		await cache.delete("a", "b")
+
+		# Assert
+		mock_client.delete.assert_called_once_with("a", "b")
+
+	async def test_incr_and_close(self):
+		"""
+		GIVEN a Redis client
+		WHEN incrementing a counter and closing the cache
+		THEN the client handles both operations
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		mock_client.incr.return_value = 2
+		cache = RedisCache(mock_client)
+
+		# Act
+		value = await cache.incr("counter")
+		await cache.close()
+
+		# Assert
+		assert value == 2
+		mock_client.aclose.assert_called_once()
+
+	@pytest.mark.parametrize(
+		"error",
+		[RedisConnectionError("refused"), RedisTimeoutError("timed out")],
+		ids=["connection", "timeout"],
+	)
+	async def test_redis_errors_fall_back_to_miss(self, error):
+		"""
+		GIVEN a Redis client that fails every command
+		WHEN using each cache operation
+		THEN misses and no-ops are returned instead of raising
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		for command in ("get", "mget", "set", "delete", "incr"):
+			getattr(mock_client, command).side_effect = error
+		cache = RedisCache(mock_client)
+
+		# Act
+		value = await cache.get("key")
+		values = await cache.get_many("a", "b")
+		await cache.set("key", "value", 30)
+		await cache.delete("key")
+		counter = await cache.incr("counter")
+
+		# Assert
+		assert value is None
+		assert values == [None, None]
+		assert counter == 0
+		mock_client.delete.assert_called_once_with("key")
+
+	async def test_failed_incr_logs_error(self, caplog):
+		"""
+		GIVEN a Redis client that fails INCR
+		WHEN bumping a version counter
+		THEN the failure is logged at error level since stale entries remain
+		"""
+		# Arrange
+		mock_client = AsyncMock()
+		mock_client.incr.side_effect = RedisConnectionError("refused")
+		cache = RedisCache(mock_client)
+
+		# Act
+		with caplog.at_level(logging.ERROR, logger="app.cache.redis_cache"):
+			counter = await cache.incr("users:version")
+
+		# Assert
+		assert counter == 0
+		errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+		assert len(errors) == 1
+		assert "users:version" in errors[0].getMessage()
@@ -3,8 +3,12 @@ Unit tests for dependency injection container
 Following AAA (Arrange-Act-Assert) pattern
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
+from app.cache.null_cache import NullCache
+from app.cache.redis_cache import RedisCache
 from app.dependencies.container import Container
 from app.repositories.user_repository import UserRepository
 from app.services.user_service import UserService
@@ -14,15 +18,14 @@ from app.services.user_service import UserService
 class TestContainer:
 	"""Test Container dependency injection."""
 
-	async def test_container_creates_repository(self, test_db_session):
+	async def test_container_creates_repository(
+		self, container, test_db_session
+	):
 		"""
 		GIVEN a container and database session
 		WHEN getting user repository
 		THEN UserRepository instance is returned
 		"""
-		# Arrange
-		container = Container()
-
 		# Act
 		repository = container.user_repository(test_db_session)
 
@@ -30,15 +33,12 @@ class TestContainer:
 		assert isinstance(repository, UserRepository)
 		assert repository.session == test_db_session
 
-	async def test_container_creates_service(self, test_db_session):
+	async def test_container_creates_service(self, container, test_db_session):
 		"""
 		GIVEN a container and database session
 		WHEN getting user service
 		THEN UserService instance is returned with injected repository
 		"""
-		# Arrange
-		container = Container()
-
 		# Act
 		service = container.user_service(test_db_session)
 
@@ -47,35 +47,82 @@ class TestContainer:
 		assert isinstance(service._user_repository, UserRepository)
 
 	async def test_container_repository_uses_correct_session(
-		self, test_db_session
+		self, container, test_db_session
 	):
 		"""
 		GIVEN a container with specific session
 		WHEN creating repository
 		THEN repository uses the provided session
 		"""
-		# Arrange
-		container = Container()
-
 		# Act
 		repository = container.user_repository(test_db_session)
 
 		# Assert
 		assert repository.session is test_db_session
 
-	async def test_container_creates_new_instances(self, test_db_session):
+	async def test_container_reuses_service_per_session(
+		self, container, test_db_session
+	):
 		"""
 		GIVEN a container
-		WHEN calling factory methods multiple times
-		THEN new instances are created each time
+		WHEN getting the user service multiple times for one session
+		THEN the same instance is returned
+		"""
+		# Act
+		service1 = container.user_service(test_db_session)
+		service2 = container.user_service(test_db_session)
+
+		# Assert
+		assert service1 is service2
+
+	async def test_container_creates_new_instances_per_session(
+		self, test_db_session
+	):
+		"""
+		GIVEN a container
+		WHEN getting the user service for different sessions
+		THEN new instances are created for each session
 		"""
 		# Arrange
 		container = Container()
+		other_session = MagicMock()
 
 		# Act
 		service1 = container.user_service(test_db_session)
-		service2 = container.user_service(test_db_session)
+		service2 = container.user_service(other_session)
 
 		# Assert
 		assert service1 is not service2
 		assert service1._user_repository is not service2._user_repository
+		assert service2._user_repository.session is other_session
+
+	def test_container_uses_null_cache_without_redis_url(self, monkeypatch):
+		"""
+		GIVEN no REDIS_URL configured
+		WHEN creating a container
+		THEN caching is disabled
+		"""
+		# Arrange
+		monkeypatch.delenv("REDIS_URL", raising=False)
+
+		# Act
+		container = Container()
+
+		# Assert
+		assert isinstance(container.cache(), NullCache)
+		assert container.cache() is container.cache()
+
+	def test_container_uses_redis_cache_with_redis_url(self, monkeypatch):
+		"""
+		GIVEN REDIS_URL configured
+		WHEN creating a container
+		THEN a Redis-backed cache is used
+		"""
+		# Arrange
+		monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+
+		# Act
+		container = Container()
+
+		# Assert
+		assert isinstance(container.cache(), RedisCache)
@@ -6,15 +6,26 @@ Testing database session management and lifecycle functions
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.database import close_db, get_db, init_db
+from app.database import (
+	DB_MAX_OVERFLOW,
+	DB_POOL_SIZE,
+	SQLITE_PRAGMAS,
+	_set_sqlite_pragmas,
+	close_db,
+	engine,
+	get_db,
+	get_read_db,
+	init_db,
+)
 
 
 @pytest.mark.unit
 class TestGetDb:
 	"""Test get_db dependency function."""
 
-	async def test_get_db_success(self):
+	async def test_get_db_success(self, mock_async_session_factory):
 		"""
 		GIVEN a database session factory
 		WHEN getting a database session
@@ -22,14 +33,12 @@ class TestGetDb:
 		"""
 		# Arrange
 		mock_session = AsyncMock()
-		mock_session.commit = AsyncMock()
-		mock_session.close = AsyncMock()
 
 		# Act
-		with patch("app.database.AsyncSessionLocal") as mock_factory:
-			mock_factory.return_value.__aenter__.return_value = mock_session
-			mock_factory.return_value.__aexit__.return_value = None
-
+		with patch(
+			"app.database.AsyncSessionLocal",
+			mock_async_session_factory(mock_session),
+		):
 			db_generator = get_db()
 			session = await db_generator.__anext__()
 
@@ -37,16 +46,14 @@ class TestGetDb:
 			assert session == mock_session
 
 			# Simulate end of context (cleanup)
-			try:
+			with pytest.raises(StopAsyncIteration):
 				await db_generator.__anext__()
-			except StopAsyncIteration:
-				pass
 
 			# Assert - commit and close were called
 			mock_session.commit.assert_called_once()
 			mock_session.close.assert_called_once()
 
-	async def test_get_db_rollback_on_error(self):
+	async def test_get_db_rollback_on_error(self, mock_async_session_factory):
 		"""
 		GIVEN a database session that encounters an error
 		WHEN an exception occurs during session usage
@@ -54,27 +61,61 @@ class TestGetDb:
 		"""
 		# Arrange
 		mock_session = AsyncMock()
-		mock_session.rollback = AsyncMock()
-		mock_session.close = AsyncMock()
-		mock_session.commit = AsyncMock(side_effect=Exception("DB Error"))
+		mock_session.commit.side_effect = SQLAlchemyError("DB Error")
 
 		# Act & Assert
-		with patch("app.database.AsyncSessionLocal") as mock_factory:
-			mock_factory.return_value.__aenter__.return_value = mock_session
-			mock_factory.return_value.__aexit__.return_value = None
-
+		with patch(
+			"app.database.AsyncSessionLocal",
+			mock_async_session_factory(mock_session),
+		):
 			db_generator = get_db()
 			session = await db_generator.__anext__()
 
 		assert session == mock_session
 
 		# Simulate error during commit - should raise the exception
-		with pytest.raises(Exception, match="DB Error"):
+		with pytest.raises(SQLAlchemyError, match="DB Error"):
 			await db_generator.__anext__()
 
 		# Assert - rollback and close were called
 		mock_session.rollback.assert_called_once()
 		mock_session.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGetReadDb:
+	"""Test get_read_db dependency function."""
+
+	async def test_get_read_db_does_not_commit(
+		self, mock_async_session_factory
+	):
+		"""
+		GIVEN a database session factory
+		WHEN getting a read-only database session
+		THEN session is yielded and never committed
+		"""
+		# Arrange
+		mock_session = AsyncMock()
+
+		# Act
+		with patch(
+			"app.database.AsyncSessionLocal",
+			mock_async_session_factory(mock_session),
+		) as mock_factory:
+			db_generator = get_read_db()
+			session = await db_generator.__anext__()
+
+			# Assert - session is yielded
+			assert session == mock_session
+
+			with pytest.raises(StopAsyncIteration):
+				await db_generator.__anext__()
+
+			# Assert - nothing was committed
+			mock_session.commit.assert_not_called()
+			mock_factory.return_value.__aexit__.assert_awaited_once()
+
+
 @pytest.mark.unit
 class TestInitDb:
 	"""Test init_db function."""
@@ -127,47 +168,44 @@ class TestCloseDb:
 
 
 @pytest.mark.unit
-class TestDatabaseIntegration:
-	"""Integration tests for database module."""
+class TestSqlitePragmas:
+	"""Test SQLite connection tuning."""
 
-	async def test_get_db_context_manager_flow(self):
+	def test_set_sqlite_pragmas_executes_all_pragmas(self):
 		"""
-		GIVEN a database session
-		WHEN using get_db in a context-like flow
-		THEN proper lifecycle is maintained
+		GIVEN a new DBAPI connection
+		WHEN the connect listener runs
+		THEN every pragma is executed and the cursor is closed
 		"""
-		# This test simulates the actual flow
-		db_gen = get_db()
+		# Arrange
+		mock_cursor = MagicMock()
+		mock_connection = MagicMock()
+		mock_connection.cursor.return_value = mock_cursor
 
-		# Get the session
-		session = await db_gen.__anext__()
-		assert session is not None
+		# Act
+		_set_sqlite_pragmas(mock_connection, None)
 
-		# Simulate successful completion
-		try:
-			await db_gen.__anext__()
-		except StopAsyncIteration:
-			# Expected - generator exhausted
-			pass
+		# Assert
+		executed = [c.args[0] for c in mock_cursor.execute.call_args_list]
+		assert executed == list(SQLITE_PRAGMAS)
+		assert "PRAGMA journal_mode=WAL" in executed
+		mock_cursor.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestEnginePool:
+	"""Test engine connection pool configuration."""
 
-	async def test_get_db_exception_handling(self):
+	def test_pool_uses_configured_size(self):
 		"""
-		GIVEN a database session with an error
-		WHEN exception occurs during session usage
-		THEN proper cleanup happens
+		GIVEN the application engine
+		WHEN inspecting its connection pool
+		THEN pool size and overflow match the configured values
 		"""
-		db_gen = get_db()
-
-		# Get the session
-		session = await db_gen.__anext__()
-		assert session is not None
-
-		# Simulate an exception
-		try:
-			await db_gen.athrow(ValueError("Test exception"))
-		except ValueError:
-			# Expected - exception should be propagated
-			pass
-		except StopAsyncIteration:
-			# Also acceptable
-			pass
+		# Act
+		pool = engine.pool
+
+		# Assert
+		assert pool.size() == DB_POOL_SIZE
+		assert pool._max_overflow == DB_MAX_OVERFLOW
+		assert pool._pre_ping is True
@@ -0,0 +1,99 @@
+"""
+Unit tests for exception handlers
+Following AAA (Arrange-Act-Assert) pattern
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+
+from app.exceptions.handlers import (
+	register_exception_handlers,
+	unhandled_exception_handler,
+	user_already_exists_handler,
+	user_not_found_handler,
+)
+from app.exceptions.user_exceptions import (
+	UserAlreadyExistsError,
+	UserNotFoundError,
+)
+
+
+@pytest.mark.unit
+class TestExceptionHandlers:
+	"""Test mapping of domain exceptions to HTTP responses."""
+
+	async def test_user_not_found_handler(self):
+		"""
+		GIVEN a UserNotFoundError
+		WHEN handling it
+		THEN 404 with the exception message is returned
+		"""
+		# Arrange
+		exc = UserNotFoundError("User with ID 123 not found")
+
+		# Act
+		response = await user_not_found_handler(MagicMock(), exc)
+
+		# Assert
+		assert response.status_code == 404
+		assert json.loads(response.body) == {
+			"detail": "User with ID 123 not found"
+		}
+
+	async def test_user_already_exists_handler(self):
+		"""
+		GIVEN a UserAlreadyExistsError
+		WHEN handling it
+		THEN 409 with the exception message is returned
+		"""
+		# Arrange
+		exc = UserAlreadyExistsError("Email already exists")
+
+		# Act
+		response = await user_already_exists_handler(MagicMock(), exc)
+
+		# Assert
+		assert response.status_code == 409
+		assert json.loads(response.body) == {"detail": "Email already exists"}
+
+	async def test_unhandled_exception_handler(self):
+		"""
+		GIVEN an unexpected exception
+		WHEN handling it
+		THEN 500 with a generic message is returned
+		"""
+		# Arrange
+		exc = Exception("database exploded")
+
+		# Act
+		response = await unhandled_exception_handler(MagicMock(), exc)
+
+		# Assert
+		assert response.status_code == 500
+		assert json.loads(response.body) == {"detail": "Internal server error"}
+
+	def test_register_exception_handlers(self):
+		"""
+		GIVEN a FastAPI application
+		WHEN registering exception handlers
+		THEN each domain exception is mapped to its handler
+		"""
+		# Arrange
+		app = FastAPI()
+
+		# Act
+		register_exception_handlers(app)
+
+		# Assert
+		assert app.exception_handlers[UserNotFoundError] is (
+			user_not_found_handler
+		)
+		assert app.exception_handlers[UserAlreadyExistsError] is (
+			user_already_exists_handler
+		)
+		assert app.exception_handlers[Exception] is (
+			unhandled_exception_handler
+		)
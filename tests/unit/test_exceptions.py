@@ -12,116 +12,66 @@ from app.exceptions.user_exceptions import (
 
 
 @pytest.mark.unit
-class TestUserNotFoundError:
-	"""Test UserNotFoundError exception."""
-
-	def test_exception_default_message(self):
-		"""
-		GIVEN no custom message
-		WHEN raising UserNotFoundError
-		THEN default message is used
-		"""
-		# Arrange & Act
-		exception = UserNotFoundError()
-
-		# Assert
-		assert str(exception) == "User not found"
-		assert exception.message == "User not found"
-
-	def test_exception_custom_message(self):
-		"""
-		GIVEN custom error message
-		WHEN raising UserNotFoundError
-		THEN custom message is used
-		"""
-		# Arrange
-		custom_message = "User with ID 123 not found"
-
-		# Act
-		exception = UserNotFoundError(custom_message)
-
-		# Assert
-		assert str(exception) == custom_message
-		assert exception.message == custom_message
-
-	def test_exception_can_be_raised(self):
-		"""
-		GIVEN UserNotFoundError
-		WHEN raising exception
-		THEN exception can be caught
-		"""
-		# Arrange & Act & Assert
-		with pytest.raises(UserNotFoundError) as exc_info:
-			raise UserNotFoundError("Test error")
-
-		assert "Test error" in str(exc_info.value)
-
-	def test_exception_inheritance(self):
-		"""
-		GIVEN UserNotFoundError
-		WHEN checking inheritance
-		THEN it inherits from Exception
-		"""
-		# Arrange
-		exception = UserNotFoundError()
-
-		# Act & Assert
-		assert isinstance(exception, Exception)
-
-
-@pytest.mark.unit
-class TestUserAlreadyExistsError:
-	"""Test UserAlreadyExistsError exception."""
+@pytest.mark.parametrize(
+	("exc_cls", "default_message"),
+	[
+		(UserNotFoundError, "User not found"),
+		(UserAlreadyExistsError, "User already exists"),
+	],
+	ids=["not-found", "already-exists"],
+)
+class TestUserExceptions:
+	"""Test the user exceptions, which share one message contract."""
 
-	def test_exception_default_message(self):
+	def test_exception_default_message(self, exc_cls, default_message):
 		"""
 		GIVEN no custom message
-		WHEN raising UserAlreadyExistsError
+		WHEN raising the exception
 		THEN default message is used
 		"""
 		# Arrange & Act
-		exception = UserAlreadyExistsError()
+		exception = exc_cls()
 
 		# Assert
-		assert str(exception) == "User already exists"
-		assert exception.message == "User already exists"
+		assert str(exception) == default_message
+		assert exception.message == default_message
 
-	def test_exception_custom_message(self):
+	def test_exception_custom_message(self, exc_cls, default_message):
 		"""
 		GIVEN custom error message
-		WHEN raising UserAlreadyExistsError
+		WHEN raising the exception
 		THEN custom message is used
 		"""
 		# Arrange
-		custom_message = "User with email test@example.com already exists"
+		custom_message = "User with ID 123 could not be processed"
 
 		# Act
-		exception = UserAlreadyExistsError(custom_message)
+		exception = exc_cls(custom_message)
 
 		# Assert
 		assert str(exception) == custom_message
 		assert exception.message == custom_message
 
-	def test_exception_can_be_raised(self):
+	def test_exception_can_be_raised(self, exc_cls, default_message):
 		"""
-		GIVEN UserAlreadyExistsError
-		WHEN raising exception
-		THEN exception can be caught
+		GIVEN the exception
+		WHEN raising it
+		THEN it can be caught by its own type
 		"""
 		# Arrange & Act & Assert
-		with pytest.raises(UserAlreadyExistsError) as exc_info:
-			raise UserAlreadyExistsError("Test error")
+		with pytest.raises(exc_cls) as exc_info:
+			raise exc_cls("Test error")
 
 		assert "Test error" in str(exc_info.value)
 
-	def test_exception_inheritance(self):
+	def test_exception_inheritance(self, exc_cls, default_message):
 		"""
-		GIVEN UserAlreadyExistsError
+		GIVEN the exception
 		WHEN checking inheritance
 		THEN it inherits from Exception
 		"""
 		# Arrange
-		exception = UserAlreadyExistsError()
+		exception = exc_cls()
 
 		# Act & Assert
 		assert isinstance(exception, Exception)
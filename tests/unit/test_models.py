@@ -3,14 +3,24 @@ Unit tests for Pydantic models
 Following AAA (Arrange-Act-Assert) pattern
 """
 
-from datetime import datetime
-from uuid import UUID
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql, sqlite
 
+from app.models.db_models import BinaryUUID, UserDB
 from app.models.user import User, UserCreate, UserResponse, UserUpdate
 
+_VALID_USER_DATA = {"name": "John Doe", "email": "john.doe@example.com"}
+
+
+@pytest.fixture(scope="module")
+def sample_user() -> User:
+	"""Build one User shared by the tests that only read it."""
+	return User(**_VALID_USER_DATA)
+
 
 @pytest.mark.unit
 class TestUserCreateModel:
@@ -22,162 +32,87 @@ class TestUserCreateModel:
 		WHEN creating UserCreate instance
 		THEN model is created successfully
 		"""
-		# Arrange
-		data = {"name": "John Doe", "email": "john.doe@example.com"}
-
 		# Act
-		user_create = UserCreate(**data)
+		user_create = UserCreate(**_VALID_USER_DATA)
 
 		# Assert
 		assert user_create.name == "John Doe"
 		assert user_create.email == "john.doe@example.com"
 
-	def test_create_user_invalid_email(self):
-		"""
-		GIVEN invalid email format
-		WHEN creating UserCreate instance
-		THEN ValidationError is raised
-		"""
-		# Arrange
-		data = {"name": "John Doe", "email": "invalid-email"}
-
-		# Act & Assert
-		with pytest.raises(ValidationError) as exc_info:
-			UserCreate(**data)
-
-		assert "email" in str(exc_info.value)
-
-	def test_create_user_missing_name(self):
+	@pytest.mark.parametrize(
+		("data", "field"),
+		[
+			({"name": "John Doe", "email": "invalid-email"}, "email"),
+			({"email": "john.doe@example.com"}, "name"),
+			({"name": "John Doe"}, "email"),
+			({"name": "", "email": "john.doe@example.com"}, "name"),
+			# max is 100
+			({"name": "a" * 101, "email": "john.doe@example.com"}, "name"),
+		],
+		ids=[
+			"invalid-email",
+			"missing-name",
+			"missing-email",
+			"empty-name",
+			"name-too-long",
+		],
+	)
+	def test_create_user_invalid(self, data, field):
 		"""
-		GIVEN missing name field
+		GIVEN invalid or incomplete user data
 		WHEN creating UserCreate instance
-		THEN ValidationError is raised
+		THEN ValidationError naming the offending field is raised
 		"""
-		# Arrange
-		data = {"email": "john.doe@example.com"}
-
 		# Act & Assert
 		with pytest.raises(ValidationError) as exc_info:
 			UserCreate(**data)
 
-		assert "name" in str(exc_info.value)
-
-	def test_create_user_missing_email(self):
-		"""
-		GIVEN missing email field
-		WHEN creating UserCreate instance
-		THEN ValidationError is raised
-		"""
-		# Arrange
-		data = {"name": "John Doe"}
-
-		# Act & Assert
-		with pytest.raises(ValidationError) as exc_info:
-			UserCreate(**data)
-
-		assert "email" in str(exc_info.value)
-
-	def test_create_user_empty_name(self):
-		"""
-		GIVEN empty name string
-		WHEN creating UserCreate instance
-		THEN ValidationError is raised
-		"""
-		# Arrange
-		data = {"name": "", "email": "john.doe@example.com"}
-
-		# Act & Assert
-		with pytest.raises(ValidationError) as exc_info:
-			UserCreate(**data)
-
-		assert "name" in str(exc_info.value)
-
-	def test_create_user_name_too_long(self):
-		"""
-		GIVEN name exceeding max length
-		WHEN creating UserCreate instance
-		THEN ValidationError is raised
-		"""
-		# Arrange
-		data = {
-			"name": "a" * 101,  # max is 100
-			"email": "john.doe@example.com",
-		}
-
-		# Act & Assert
-		with pytest.raises(ValidationError) as exc_info:
-			UserCreate(**data)
-
-		assert "name" in str(exc_info.value)
+		assert field in str(exc_info.value)
 
 
 @pytest.mark.unit
 class TestUserUpdateModel:
 	"""Test UserUpdate model validation."""
 
-	def test_update_user_all_fields(self):
+	@pytest.mark.parametrize(
+		("data", "name", "email"),
+		[
+			(
+				{"name": "Updated Name", "email": "updated@example.com"},
+				"Updated Name",
+				"updated@example.com",
+			),
+			({"name": "Updated Name"}, "Updated Name", None),
+			({"email": "updated@example.com"}, None, "updated@example.com"),
+			({}, None, None),
+		],
+		ids=["all-fields", "name-only", "email-only", "empty-body"],
+	)
+	def test_update_user_valid(self, data, name, email):
 		"""
-		GIVEN all fields for update
+		GIVEN all, some or none of the fields for update
 		WHEN creating UserUpdate instance
-		THEN model is created successfully
+		THEN model is created and omitted fields are None
 		"""
-		# Arrange
-		data = {"name": "Updated Name", "email": "updated@example.com"}
-
 		# Act
 		user_update = UserUpdate(**data)
 
 		# Assert
-		assert user_update.name == "Updated Name"
-		assert user_update.email == "updated@example.com"
+		assert user_update.name == name
+		assert user_update.email == email
 
-	def test_update_user_partial_name_only(self):
+	@pytest.mark.parametrize("field", ["name", "email"])
+	def test_update_user_rejects_null(self, field):
 		"""
-		GIVEN only name field
+		GIVEN an explicit null for a required field
 		WHEN creating UserUpdate instance
-		THEN model is created with name, email is None
+		THEN ValidationError naming the field is raised
 		"""
-		# Arrange
-		data = {"name": "Updated Name"}
-
-		# Act
-		user_update = UserUpdate(**data)
-
-		# Assert
-		assert user_update.name == "Updated Name"
-		assert user_update.email is None
-
-	def test_update_user_partial_email_only(self):
-		"""
-		GIVEN only email field
-		WHEN creating UserUpdate instance
-		THEN model is created with email, name is None
-		"""
-		# Arrange
-		data = {"email": "updated@example.com"}
-
-		# Act
-		user_update = UserUpdate(**data)
-
-		# Assert
-		assert user_update.name is None
-		assert user_update.email == "updated@example.com"
-
-	def test_update_user_empty_body(self):
-		"""
-		GIVEN empty update data
-		WHEN creating UserUpdate instance
-		THEN model is created with all None values
-		"""
-		# Arrange
-		data = {}
-
-		# Act
-		user_update = UserUpdate(**data)
+		# Act & Assert
+		with pytest.raises(ValidationError) as exc_info:
+			UserUpdate(**{field: None})
 
-		# Assert
-		assert user_update.name is None
-		assert user_update.email is None
+		assert field in str(exc_info.value)
 
 	def test_update_user_invalid_email(self):
 		"""
@@ -225,8 +160,6 @@ class TestUserModel:
 		THEN custom UUID is used
 		"""
 		# Arrange
-		from uuid import uuid4
-
 		custom_id = uuid4()
 		data = {
 			"id": custom_id,
@@ -245,34 +178,30 @@ class TestUserModel:
 class TestUserResponseModel:
 	"""Test UserResponse model."""
 
-	def test_user_response_from_user(self):
+	def test_user_response_from_user(self, sample_user):
 		"""
 		GIVEN a User instance
 		WHEN creating UserResponse
 		THEN response model is created correctly
 		"""
-		# Arrange
-		user = User(name="John Doe", email="john.doe@example.com")
-
 		# Act
-		response = UserResponse.model_validate(user)
+		response = UserResponse.model_validate(sample_user)
 
 		# Assert
-		assert response.name == user.name
-		assert response.email == user.email
-		assert response.id == user.id
-		assert response.created_at == user.created_at
-		assert response.updated_at == user.updated_at
+		assert response.name == sample_user.name
+		assert response.email == sample_user.email
+		assert response.id == sample_user.id
+		assert response.created_at == sample_user.created_at
+		assert response.updated_at == sample_user.updated_at
 
-	def test_user_response_serialization(self):
+	def test_user_response_serialization(self, sample_user):
 		"""
 		GIVEN a UserResponse instance
 		WHEN converting to dict
 		THEN all fields are serialized correctly
 		"""
 		# Arrange
-		user = User(name="John Doe", email="john.doe@example.com")
-		response = UserResponse.model_validate(user)
+		response = UserResponse.model_validate(sample_user)
 
 		# Act
 		data = response.model_dump()
@@ -284,3 +213,117 @@ class TestUserResponseModel:
 		assert "created_at" in data
 		assert "updated_at" in data
 		assert data["name"] == "John Doe"
+
+	def test_user_response_is_frozen(self, sample_user):
+		"""
+		GIVEN a UserResponse instance
+		WHEN assigning to a field
+		THEN a validation error is raised and the field is unchanged
+		"""
+		# Arrange
+		response = UserResponse.model_validate(sample_user)
+
+		# Act & Assert
+		with pytest.raises(ValidationError):
+			response.name = "Jane Doe"
+		assert response.name == sample_user.name
+
+
+@pytest.mark.unit
+class TestBinaryUUIDType:
+	"""Test BinaryUUID column type."""
+
+	def test_sqlite_round_trip_uses_16_bytes(self):
+		"""
+		GIVEN a UUID and the SQLite dialect
+		WHEN binding and loading the value
+		THEN it is stored as 16 raw bytes and restored unchanged
+		"""
+		# Arrange
+		column_type = BinaryUUID()
+		dialect = sqlite.dialect()
+		value = uuid4()
+
+		# Act
+		stored = column_type.process_bind_param(value, dialect)
+		loaded = column_type.process_result_value(stored, dialect)
+
+		# Assert
+		assert stored == value.bytes
+		assert len(stored) == 16
+		assert loaded == value
+
+	def test_postgresql_uses_native_uuid(self):
+		"""
+		GIVEN the PostgreSQL dialect
+		WHEN binding a UUID
+		THEN the value is passed through to the native uuid column
+		"""
+		# Arrange
+		column_type = BinaryUUID()
+		dialect = postgresql.dialect()
+		value = uuid4()
+
+		# Act
+		stored = column_type.process_bind_param(value, dialect)
+		loaded = column_type.process_result_value(stored, dialect)
+
+		# Assert
+		assert stored is value
+		assert loaded is value
+		assert column_type.load_dialect_impl(dialect).as_uuid is True
+
+	def test_none_is_passed_through(self):
+		"""
+		GIVEN a NULL value
+		WHEN binding and loading it
+		THEN None is returned
+		"""
+		# Arrange
+		column_type = BinaryUUID()
+		dialect = sqlite.dialect()
+
+		# Act & Assert
+		assert column_type.process_bind_param(None, dialect) is None
+		assert column_type.process_result_value(None, dialect) is None
+
+
+@pytest.mark.unit
+class TestUserDBModel:
+	"""Test UserDB table definition."""
+
+	def test_timestamps_are_timezone_aware_columns(self):
+		"""
+		GIVEN the users table
+		WHEN inspecting the timestamp columns
+		THEN they are declared timezone aware
+		"""
+		# Arrange
+		columns = UserDB.__table__.c
+
+		# Act & Assert
+		assert columns.created_at.type.timezone is True
+		assert columns.updated_at.type.timezone is True
+
+	def test_timestamps_load_as_utc_on_sqlite(self):
+		"""
+		GIVEN the SQLite dialect, which stores naive timestamps
+		WHEN binding an aware timestamp and loading it back
+		THEN it is stored in UTC and loaded tagged as UTC
+		"""
+		# Arrange
+		column_type = UserDB.__table__.c.created_at.type
+		dialect = sqlite.dialect()
+		value = datetime(2024, 1, 1, 12, 30, 0, 123456, tzinfo=UTC)
+		local = value.astimezone(timezone(timedelta(hours=-3)))
+
+		# Act
+		stored = column_type.process_bind_param(local, dialect)
+		loaded = column_type.process_result_value(
+			stored.replace(tzinfo=None), dialect
+		)
+
+		# Assert
+		assert stored == value
+		assert loaded == value
+		assert loaded.tzinfo == UTC
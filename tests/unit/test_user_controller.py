@@ -3,119 +3,100 @@ Unit tests for UserController
 Testing controller logic with mocked dependencies
 """
 
+from typing import List
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import orjson
 import pytest
-from fastapi import HTTPException
 
-from app.controllers.user_controller import UserController
-from app.dependencies.container import Container
+from app.controllers.user_controller import (
+	CACHE_TTL_SECONDS,
+	USERS_VERSION_KEY,
+	UserController,
+)
 from app.exceptions.user_exceptions import (
 	UserAlreadyExistsError,
 	UserNotFoundError,
 )
-from tests.factories import create_user, create_user_data
+from app.models.user import (
+	User,
+	UserCreate,
+	UserListResponse,
+	UserResponse,
+	UserUpdate,
+)
+from tests.factories import create_fake_user, create_user, create_user_data
+
+
+def _as_async(result):
+	"""Build a coroutine function returning result, recording no calls."""
+
+	async def _call(*args, **kwargs):
+		return result
+
+	return _call
+
+
+@pytest.fixture(scope="module")
+def sample_user_data() -> UserCreate:
+	"""Build one UserCreate shared by the tests that only read it."""
+	return create_user_data(name="Test User")
+
+
+@pytest.fixture(scope="module")
+def sample_users_batch() -> List[User]:
+	"""Build three Users shared by the tests that only read them."""
+	return [create_fake_user(id=UUID(int=i)) for i in range(1, 4)]
 
 
 @pytest.mark.unit
 class TestUserControllerCreate:
 	"""Test UserController.create_user method."""
 
-	async def test_create_user_success(self):
+	async def test_create_user_success(
+		self, mock_container, mock_user_service, sample_user_data
+	):
 		"""
 		GIVEN valid user data
 		WHEN creating a user through controller
 		THEN user is created successfully
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
+		mock_session = AsyncMock()
 
 		expected_user = create_user(name="Test User")
-		mock_service.create.return_value = expected_user
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.create.return_value = expected_user
 
 		controller = UserController(mock_container)
-		user_data = create_user_data(name="Test User")
 
 		# Act
-		result = await controller.create_user(user_data, mock_session)
+		result = await controller.create_user(sample_user_data, mock_session)
 
 		# Assert
-		assert result.name == "Test User"
-		mock_service.create.assert_called_once_with(user_data)
-
-	async def test_create_user_already_exists(self):
-		"""
-		GIVEN a duplicate email
-		WHEN creating a user
-		THEN 409 Conflict is raised
-		"""
-		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
-
-		mock_service.create.side_effect = UserAlreadyExistsError(
-			"Email already exists"
+		assert result.status_code == 201
+		assert UserResponse.model_validate_json(result.body).name == (
+			"Test User"
 		)
-		mock_container.user_service.return_value = mock_service
-
-		controller = UserController(mock_container)
-		user_data = create_user_data()
-
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.create_user(user_data, mock_session)
-
-		assert exc_info.value.status_code == 409
-
-	async def test_create_user_internal_error(self):
-		"""
-		GIVEN an unexpected error during creation
-		WHEN creating a user
-		THEN 500 Internal Server Error is raised
-		"""
-		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
-
-		mock_service.create.side_effect = Exception("Unexpected error")
-		mock_container.user_service.return_value = mock_service
-
-		controller = UserController(mock_container)
-		user_data = create_user_data()
-
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.create_user(user_data, mock_session)
-
-		assert exc_info.value.status_code == 500
-		assert "Internal server error" in str(exc_info.value.detail)
+		mock_user_service.create.assert_called_once_with(sample_user_data)
 
 
 @pytest.mark.unit
 class TestUserControllerGet:
 	"""Test UserController.get_user method."""
 
-	async def test_get_user_success(self):
+	async def test_get_user_success(self, mock_container, mock_user_service):
 		"""
 		GIVEN an existing user id
 		WHEN getting user
 		THEN user is returned
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
 		mock_session = MagicMock()
 
 		user_id = uuid4()
 		expected_user = create_user(id=user_id)
-		mock_service.get_by_id.return_value = expected_user
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.get_by_id.return_value = expected_user
 
 		controller = UserController(mock_container)
 
@@ -123,76 +104,26 @@ class TestUserControllerGet:
 		result = await controller.get_user(user_id, mock_session)
 
 		# Assert
-		assert result.id == user_id
-		mock_service.get_by_id.assert_called_once_with(user_id)
-
-	async def test_get_user_not_found(self):
-		"""
-		GIVEN a non-existent user id
-		WHEN getting user
-		THEN 404 Not Found is raised
-		"""
-		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
-
-		user_id = uuid4()
-		mock_service.get_by_id.side_effect = UserNotFoundError(
-			"User not found"
-		)
-		mock_container.user_service.return_value = mock_service
-
-		controller = UserController(mock_container)
-
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.get_user(user_id, mock_session)
-
-		assert exc_info.value.status_code == 404
-
-	async def test_get_user_internal_error(self):
-		"""
-		GIVEN an unexpected error during retrieval
-		WHEN getting user
-		THEN 500 Internal Server Error is raised
-		"""
-		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
-
-		user_id = uuid4()
-		mock_service.get_by_id.side_effect = Exception("Unexpected error")
-		mock_container.user_service.return_value = mock_service
-
-		controller = UserController(mock_container)
-
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.get_user(user_id, mock_session)
-
-		assert exc_info.value.status_code == 500
+		assert UserResponse.model_validate_json(result.body).id == user_id
+		mock_user_service.get_by_id.assert_called_once_with(user_id)
 
 
 @pytest.mark.unit
 class TestUserControllerGetAll:
 	"""Test UserController.get_users method."""
 
-	async def test_get_all_users_success(self):
+	async def test_get_all_users_success(
+		self, mock_container, mock_user_service, sample_users_batch
+	):
 		"""
 		GIVEN users in database
 		WHEN getting all users
 		THEN paginated list is returned
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
 		mock_session = MagicMock()
 
-		users = [create_user() for _ in range(3)]
-		mock_service.get_all.return_value = (users, 3)
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.get_all.return_value = (sample_users_batch, 3)
 
 		controller = UserController(mock_container)
 
@@ -202,59 +133,74 @@ class TestUserControllerGetAll:
 		)
 
 		# Assert
-		assert len(result.users) == 3
-		assert result.total == 3
-		assert result.page == 1
-		assert result.per_page == 10
-		mock_service.get_all.assert_called_once_with(0, 10)
-
-	async def test_get_all_users_internal_error(self):
+		page = UserListResponse.model_validate_json(result.body)
+		assert result.media_type == "application/json"
+		assert len(page.users) == 3
+		assert page.total == 3
+		assert page.page == 1
+		assert page.per_page == 10
+		mock_user_service.get_all.assert_called_once_with(0, 10)
+
+	async def test_get_all_users_matches_pydantic_encoding(
+		self,
+		mock_container,
+		mock_user_service,
+		sample_users_batch,
+		monkeypatch,
+	):
 		"""
-		GIVEN an unexpected error during retrieval
+		GIVEN users in database
 		WHEN getting all users
-		THEN 500 Internal Server Error is raised
+		THEN the body matches the UserListResponse JSON encoding
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
 		mock_session = MagicMock()
 
-		mock_service.get_all.side_effect = Exception("Unexpected error")
-		mock_container.user_service.return_value = mock_service
+		monkeypatch.setattr(
+			mock_user_service, "get_all", _as_async((sample_users_batch, 3))
+		)
 
 		controller = UserController(mock_container)
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.get_users(session=mock_session)
+		# Act
+		result = await controller.get_users(
+			page=1, per_page=10, session=mock_session
+		)
 
-		assert exc_info.value.status_code == 500
+		# Assert
+		expected = UserListResponse(
+			users=sample_users_batch,
+			total=3,
+			page=1,
+			per_page=10,
+			total_pages=1,
+		)
+		assert orjson.loads(result.body) == orjson.loads(
+			expected.model_dump_json()
+		)
 
 
 @pytest.mark.unit
 class TestUserControllerUpdate:
 	"""Test UserController.update_user method."""
 
-	async def test_update_user_success(self):
+	async def test_update_user_success(
+		self, mock_container, mock_user_service
+	):
 		"""
 		GIVEN an existing user and update data
 		WHEN updating user
 		THEN user is updated successfully
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
+		mock_session = AsyncMock()
 
 		user_id = uuid4()
 		updated_user = create_user(id=user_id, name="Updated Name")
-		mock_service.update.return_value = updated_user
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.update.return_value = updated_user
 
 		controller = UserController(mock_container)
 
-		from app.models.user import UserUpdate
-
 		update_data = UserUpdate(name="Updated Name")
 
 		# Act
@@ -263,163 +209,410 @@ class TestUserControllerUpdate:
 		)
 
 		# Assert
-		assert result.name == "Updated Name"
-		mock_service.update.assert_called_once_with(user_id, update_data)
+		assert UserResponse.model_validate_json(result.body).name == (
+			"Updated Name"
+		)
+		mock_user_service.update.assert_called_once_with(user_id, update_data)
+
+
+@pytest.mark.unit
+class TestUserControllerDelete:
+	"""Test UserController.delete_user method."""
 
-	async def test_update_user_not_found(self):
+	async def test_delete_user_success(
+		self, mock_container, mock_user_service
+	):
 		"""
-		GIVEN a non-existent user id
-		WHEN updating user
-		THEN 404 Not Found is raised
+		GIVEN an existing user id
+		WHEN deleting user
+		THEN 204 No Content is returned
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
+		mock_session = AsyncMock()
 
 		user_id = uuid4()
-		mock_service.update.side_effect = UserNotFoundError("User not found")
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.delete.return_value = True
 
 		controller = UserController(mock_container)
 
-		from app.models.user import UserUpdate
+		# Act
+		result = await controller.delete_user(user_id, mock_session)
 
-		update_data = UserUpdate(name="Updated Name")
+		# Assert
+		assert result.status_code == 204
+		mock_user_service.delete.assert_called_once_with(user_id)
+
+	async def test_delete_user_returns_fresh_response(self, mock_container):
+		"""
+		GIVEN two delete requests
+		WHEN the controller handles them
+		THEN each gets its own response, so background tasks never leak
+		"""
+		# Arrange
+		controller = UserController(mock_container)
+
+		# Act
+		first = await controller.delete_user(uuid4(), AsyncMock())
+		second = await controller.delete_user(uuid4(), AsyncMock())
+
+		# Assert
+		assert first is not second
+		assert first.background is None
+		assert second.background is None
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.update_user(user_id, update_data, mock_session)
 
-		assert exc_info.value.status_code == 404
+@pytest.mark.unit
+class TestUserControllerCache:
+	"""Test UserController response caching."""
 
-	async def test_update_user_duplicate_email(self):
+	async def test_get_users_returns_cached_page(
+		self, mock_container, mock_user_service
+	):
 		"""
-		GIVEN a duplicate email during update
-		WHEN updating user
-		THEN 409 Conflict is raised
+		GIVEN a users page cached for the current list version
+		WHEN getting all users
+		THEN cached page is returned without hitting the service
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
+		mock_cache = AsyncMock()
 		mock_session = MagicMock()
 
-		user_id = uuid4()
-		mock_service.update.side_effect = UserAlreadyExistsError(
-			"Email already exists"
-		)
-		mock_container.user_service.return_value = mock_service
+		cached_page = UserListResponse(
+			users=[], total=0, page=1, per_page=10, total_pages=1
+		).model_dump_json()
+		mock_cache.get_many.return_value = [
+			b"3",
+			b"3:" + cached_page.encode(),
+		]
+		mock_container.cache.return_value = mock_cache
 
 		controller = UserController(mock_container)
 
-		from app.models.user import UserUpdate
+		# Act
+		result = await controller.get_users(
+			page=1, per_page=10, session=mock_session
+		)
+
+		# Assert
+		assert result.body == cached_page.encode()
+		mock_cache.get_many.assert_called_once_with(
+			USERS_VERSION_KEY, "users:list:1:10"
+		)
+		mock_user_service.get_all.assert_not_called()
 
-		update_data = UserUpdate(email="duplicate@test.com")
+	async def test_get_users_ignores_stale_cached_page(
+		self, mock_container, mock_user_service
+	):
+		"""
+		GIVEN a users page cached for an older list version
+		WHEN getting all users
+		THEN the page is rebuilt and cached under the current version
+		"""
+		# Arrange
+		mock_cache = AsyncMock()
+		mock_session = MagicMock()
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.update_user(user_id, update_data, mock_session)
+		mock_cache.get_many.return_value = [b"4", b"3:{}"]
+		mock_user_service.get_all.return_value = ([], 0)
+		mock_container.cache.return_value = mock_cache
 
-		assert exc_info.value.status_code == 409
+		controller = UserController(mock_container)
+
+		# Act
+		result = await controller.get_users(
+			page=1, per_page=10, session=mock_session
+		)
 
-	async def test_update_user_internal_error(self):
+		# Assert
+		mock_user_service.get_all.assert_called_once_with(0, 10)
+		mock_cache.set.assert_called_once_with(
+			"users:list:1:10", b"4:" + result.body, CACHE_TTL_SECONDS
+		)
+
+	async def test_get_user_caches_response(
+		self, mock_container, mock_user_service, monkeypatch
+	):
 		"""
-		GIVEN an unexpected error during update
-		WHEN updating user
-		THEN 500 Internal Server Error is raised
+		GIVEN a user that is not cached
+		WHEN getting user
+		THEN user is loaded from the service and cached
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
+		mock_cache = AsyncMock()
 		mock_session = MagicMock()
 
 		user_id = uuid4()
-		mock_service.update.side_effect = Exception("Unexpected error")
-		mock_container.user_service.return_value = mock_service
+		monkeypatch.setattr(
+			mock_user_service, "get_by_id", _as_async(create_user(id=user_id))
+		)
+		mock_cache.get_many.return_value = [b"2", None]
+		mock_container.cache.return_value = mock_cache
 
 		controller = UserController(mock_container)
 
-		from app.models.user import UserUpdate
+		# Act
+		result = await controller.get_user(user_id, mock_session)
 
-		update_data = UserUpdate(name="New Name")
+		# Assert
+		mock_cache.set.assert_called_once_with(
+			f"users:id:{user_id}",
+			b"2:" + result.body,
+			CACHE_TTL_SECONDS,
+		)
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.update_user(user_id, update_data, mock_session)
+	async def test_get_user_ignores_stale_cached_user(
+		self, mock_container, mock_user_service
+	):
+		"""
+		GIVEN a user cached under an older users version
+		WHEN getting user
+		THEN the user is reloaded and cached under the current version
+		"""
+		# Arrange
+		mock_cache = AsyncMock()
+		mock_session = MagicMock()
 
-		assert exc_info.value.status_code == 500
+		user_id = uuid4()
+		mock_user_service.get_by_id.return_value = create_user(id=user_id)
+		mock_cache.get_many.return_value = [b"3", b"2:{}"]
+		mock_container.cache.return_value = mock_cache
 
+		controller = UserController(mock_container)
 
-@pytest.mark.unit
-class TestUserControllerDelete:
-	"""Test UserController.delete_user method."""
+		# Act
+		result = await controller.get_user(user_id, mock_session)
+
+		# Assert
+		mock_user_service.get_by_id.assert_called_once_with(user_id)
+		mock_cache.set.assert_called_once_with(
+			f"users:id:{user_id}", b"3:" + result.body, CACHE_TTL_SECONDS
+		)
 
-	async def test_delete_user_success(self):
+	async def test_get_user_returns_cached_bytes(
+		self, mock_container, mock_user_service
+	):
 		"""
-		GIVEN an existing user id
-		WHEN deleting user
-		THEN 204 No Content is returned
+		GIVEN a user cached under the current users version
+		WHEN getting user
+		THEN cached JSON is returned as-is without hitting the service
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
+		mock_cache = AsyncMock()
 		mock_session = MagicMock()
 
 		user_id = uuid4()
-		mock_service.delete.return_value = True
-		mock_container.user_service.return_value = mock_service
+		cached_user = UserResponse.model_validate(
+			create_user(id=user_id)
+		).model_dump_json()
+		mock_cache.get_many.return_value = [
+			b"2",
+			b"2:" + cached_user.encode(),
+		]
+		mock_container.cache.return_value = mock_cache
 
 		controller = UserController(mock_container)
 
 		# Act
-		result = await controller.delete_user(user_id, mock_session)
+		result = await controller.get_user(user_id, mock_session)
 
 		# Assert
-		assert result.status_code == 204
-		mock_service.delete.assert_called_once_with(user_id)
+		assert result.body == cached_user.encode()
+		assert result.media_type == "application/json"
+		mock_cache.get_many.assert_called_once_with(
+			USERS_VERSION_KEY, f"users:id:{user_id}"
+		)
+		mock_user_service.get_by_id.assert_not_called()
 
-	async def test_delete_user_not_found(self):
+	async def test_create_user_bumps_users_version(
+		self, mock_container, mock_user_service, monkeypatch
+	):
 		"""
-		GIVEN a non-existent user id
-		WHEN deleting user
-		THEN 404 Not Found is raised
+		GIVEN cached users pages
+		WHEN creating a user
+		THEN users version is bumped
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
+		mock_cache = AsyncMock()
+		mock_session = AsyncMock()
 
-		user_id = uuid4()
-		mock_service.delete.side_effect = UserNotFoundError("User not found")
-		mock_container.user_service.return_value = mock_service
+		monkeypatch.setattr(
+			mock_user_service, "create", _as_async(create_user())
+		)
+		mock_container.cache.return_value = mock_cache
 
 		controller = UserController(mock_container)
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.delete_user(user_id, mock_session)
+		# Act
+		await controller.create_user(create_user_data(), mock_session)
 
-		assert exc_info.value.status_code == 404
+		# Assert
+		mock_cache.incr.assert_called_once_with(USERS_VERSION_KEY)
+		mock_cache.delete.assert_not_called()
 
-	async def test_delete_user_internal_error(self):
+	async def test_delete_user_bumps_users_version(
+		self, mock_container, mock_user_service
+	):
 		"""
-		GIVEN an unexpected error during deletion
-		WHEN deleting user
-		THEN 500 Internal Server Error is raised
+		GIVEN a cached user
+		WHEN deleting the user
+		THEN users version is bumped, which stales the cached user
 		"""
 		# Arrange
-		mock_container = MagicMock(spec=Container)
-		mock_service = AsyncMock()
-		mock_session = MagicMock()
+		mock_cache = AsyncMock()
+		mock_session = AsyncMock()
 
 		user_id = uuid4()
-		mock_service.delete.side_effect = Exception("Unexpected error")
-		mock_container.user_service.return_value = mock_service
+		mock_user_service.delete.return_value = True
+		mock_container.cache.return_value = mock_cache
 
 		controller = UserController(mock_container)
 
-		# Act & Assert
-		with pytest.raises(HTTPException) as exc_info:
-			await controller.delete_user(user_id, mock_session)
+		# Act
+		await controller.delete_user(user_id, mock_session)
+
+		# Assert
+		mock_cache.incr.assert_called_once_with(USERS_VERSION_KEY)
+		mock_cache.delete.assert_not_called()
+
+	@pytest.mark.parametrize(
+		("handler", "make_args"),
+		[
+			("create_user", lambda: (create_user_data(),)),
+			("update_user", lambda: (uuid4(), UserUpdate(name="New Name"))),
+			("delete_user", lambda: (uuid4(),)),
+		],
+		ids=["create", "update", "delete"],
+	)
+	async def test_write_commits_before_invalidating(
+		self, mock_container, handler, make_args
+	):
+		"""
+		GIVEN a write request
+		WHEN the controller handles it
+		THEN the session is committed before the cache is invalidated
+		"""
+		# Arrange
+		mock_service = mock_container.user_service.return_value
+		mock_service.create.return_value = create_user()
+		mock_service.update.return_value = create_user()
+		calls = MagicMock()
+		mock_session = AsyncMock()
+		mock_cache = AsyncMock()
+		calls.attach_mock(mock_session.commit, "commit")
+		calls.attach_mock(mock_cache.incr, "incr")
+		mock_container.cache.return_value = mock_cache
 
-		assert exc_info.value.status_code == 500
+		controller = UserController(mock_container)
+
+		# Act
+		await getattr(controller, handler)(*make_args(), session=mock_session)
+
+		# Assert
+		assert [name for name, _, _ in calls.mock_calls] == ["commit", "incr"]
+
+
+@pytest.mark.unit
+class TestUserControllerErrors:
+	"""Test that service errors propagate to the exception handlers."""
+
+	@pytest.mark.parametrize(
+		("handler", "service_method", "make_args", "error"),
+		[
+			(
+				"create_user",
+				"create",
+				lambda: (create_user_data(),),
+				UserAlreadyExistsError("Email already exists"),
+			),
+			(
+				"create_user",
+				"create",
+				lambda: (create_user_data(),),
+				Exception("Unexpected error"),
+			),
+			(
+				"get_user",
+				"get_by_id",
+				lambda: (uuid4(),),
+				UserNotFoundError("User not found"),
+			),
+			(
+				"get_user",
+				"get_by_id",
+				lambda: (uuid4(),),
+				Exception("Unexpected error"),
+			),
+			(
+				"get_users",
+				"get_all",
+				lambda: (),
+				Exception("Unexpected error"),
+			),
+			(
+				"update_user",
+				"update",
+				lambda: (uuid4(), UserUpdate(name="New Name")),
+				UserNotFoundError("User not found"),
+			),
+			(
+				"update_user",
+				"update",
+				lambda: (uuid4(), UserUpdate(email="duplicate@test.com")),
+				UserAlreadyExistsError("Email already exists"),
+			),
+			(
+				"update_user",
+				"update",
+				lambda: (uuid4(), UserUpdate(name="New Name")),
+				Exception("Unexpected error"),
+			),
+			(
+				"delete_user",
+				"delete",
+				lambda: (uuid4(),),
+				UserNotFoundError("User not found"),
+			),
+			(
+				"delete_user",
+				"delete",
+				lambda: (uuid4(),),
+				Exception("Unexpected error"),
+			),
+		],
+		ids=[
+			"create-already-exists",
+			"create-internal",
+			"get-not-found",
+			"get-internal",
+			"get-all-internal",
+			"update-not-found",
+			"update-duplicate-email",
+			"update-internal",
+			"delete-not-found",
+			"delete-internal",
+		],
+	)
+	async def test_service_error_propagates(
+		self,
+		mock_container,
+		handler,
+		service_method,
+		make_args,
+		error,
+	):
+		"""
+		GIVEN a service call that raises
+		WHEN the matching controller handler runs
+		THEN the same error propagates to the handlers
+		"""
+		# Arrange
+		mock_service = mock_container.user_service.return_value
+		getattr(mock_service, service_method).side_effect = error
+		controller = UserController(mock_container)
+
+		# Act & Assert
+		with pytest.raises(type(error)) as exc_info:
+			await getattr(controller, handler)(
+				*make_args(), session=MagicMock()
+			)
+		assert exc_info.value is error
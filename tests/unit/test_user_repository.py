@@ -3,27 +3,38 @@ Unit tests for UserRepository
 Following AAA (Arrange-Act-Assert) pattern
 """
 
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from app.exceptions.user_exceptions import UserAlreadyExistsError
+from app.models.db_models import UserDB
+from app.models.user import UserUpdate
 from app.repositories.user_repository import UserRepository
 from tests.factories import create_user_data
+from tests.helpers import insert_users
+
+
+@pytest.fixture
+def repository(test_db_session) -> UserRepository:
+	"""Build a UserRepository bound to the test session."""
+	return UserRepository(test_db_session)
 
 
 @pytest.mark.unit
 class TestUserRepositoryCreate:
 	"""Test UserRepository.create method."""
 
-	async def test_create_user_success(self, test_db_session):
+	async def test_create_user_success(self, repository):
 		"""
 		GIVEN a valid user data
 		WHEN creating a new user
 		THEN user is created successfully with all fields
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
 		user_data = create_user_data(
 			name="John Doe", email="john.doe@example.com"
 		)
@@ -39,14 +50,28 @@ class TestUserRepositoryCreate:
 		assert user.created_at is not None
 		assert user.updated_at is not None
 
-	async def test_create_user_duplicate_email(self, test_db_session):
+	async def test_create_user_issues_single_insert(
+		self, repository, query_counter
+	):
+		"""
+		GIVEN a valid user data
+		WHEN creating a new user
+		THEN only the INSERT statement reaches the database
+		"""
+		# Act
+		await repository.create(create_user_data())
+
+		# Assert
+		assert len(query_counter) == 1
+		assert query_counter[0].startswith("INSERT INTO users")
+
+	async def test_create_user_duplicate_email(self, repository):
 		"""
 		GIVEN an existing user with an email
 		WHEN creating a new user with the same email
 		THEN UserAlreadyExistsError is raised
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
 		user_data = create_user_data(email="duplicate@example.com")
 		await repository.create(user_data)
 
@@ -56,20 +81,20 @@ class TestUserRepositoryCreate:
 			await repository.create(duplicate_data)
 
 		assert "already exists" in str(exc_info.value)
+		assert isinstance(exc_info.value.__cause__, IntegrityError)
 
 
 @pytest.mark.unit
 class TestUserRepositoryGetById:
 	"""Test UserRepository.get_by_id method."""
 
-	async def test_get_user_by_id_success(self, test_db_session):
+	async def test_get_user_by_id_success(self, repository):
 		"""
 		GIVEN an existing user in database
 		WHEN getting user by id
 		THEN correct user is returned
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
 		user_data = create_user_data()
 		created_user = await repository.create(user_data)
 
@@ -81,19 +106,16 @@ class TestUserRepositoryGetById:
 		assert retrieved_user.id == created_user.id
 		assert retrieved_user.email == created_user.email
 		assert retrieved_user.name == created_user.name
+		assert isinstance(retrieved_user.id, UUID)
 
-	async def test_get_user_by_id_not_found(self, test_db_session):
+	async def test_get_user_by_id_not_found(self, repository, nonexistent_id):
 		"""
 		GIVEN a non-existent user id
 		WHEN getting user by id
 		THEN None is returned
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-		non_existent_id = uuid4()
-
 		# Act
-		user = await repository.get_by_id(non_existent_id)
+		user = await repository.get_by_id(nonexistent_id)
 
 		# Assert
 		assert user is None
@@ -103,32 +125,34 @@ class TestUserRepositoryGetById:
 class TestUserRepositoryGetAll:
 	"""Test UserRepository.get_all method."""
 
-	async def test_get_all_users_empty(self, test_db_session):
+	async def test_get_all_users_empty(self, repository):
 		"""
 		GIVEN an empty database
 		WHEN getting all users
 		THEN empty list is returned
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-
 		# Act
 		users = await repository.get_all()
 
 		# Assert
 		assert users == []
 
-	async def test_get_all_users_with_pagination(self, test_db_session):
+	async def test_get_all_users_with_pagination(
+		self, repository, test_db_session
+	):
 		"""
 		GIVEN multiple users is database
 		WHEN getting users with pagination
 		THEN correct subset of users is returned
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
-		for i in range(5):
-			user_data = create_user_data(email=f"user{i}@example.com")
-			await repository.create(user_data)
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(5)
+			],
+		)
 
 		# Act
 		users_page_1 = await repository.get_all(skip=0, limit=2)
@@ -139,24 +163,154 @@ class TestUserRepositoryGetAll:
 		assert len(users_page_2) == 2
 		assert users_page_1[0].id != users_page_2[0].id
 
+	async def test_iter_all_streams_users(self, repository, test_db_session):
+		"""
+		GIVEN multiple users in database
+		WHEN streaming a page of users
+		THEN users are yielded one by one up to the limit
+		"""
+		# Arrange
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(3)
+			],
+		)
+
+		# Act
+		users = [user async for user in repository.iter_all(skip=0, limit=2)]
+
+		# Assert
+		assert len(users) == 2
+		assert all(isinstance(user.id, UUID) for user in users)
+
+
+@pytest.mark.unit
+class TestUserRepositoryGetAllWithTotal:
+	"""Test UserRepository.get_all_with_total method."""
+
+	async def test_get_all_with_total_returns_page_and_total(
+		self, repository, test_db_session
+	):
+		"""
+		GIVEN multiple users in database
+		WHEN getting a page of users with the total
+		THEN the page and the overall count are returned
+		"""
+		# Arrange
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(5)
+			],
+		)
+
+		# Act
+		users, total = await repository.get_all_with_total(skip=0, limit=2)
+
+		# Assert
+		assert len(users) == 2
+		assert total == 5
+
+	async def test_get_all_with_total_past_last_page(self, repository):
+		"""
+		GIVEN users in database
+		WHEN requesting a page past the last one
+		THEN an empty page is returned with the overall count
+		"""
+		# Arrange
+		await repository.create(create_user_data())
+
+		# Act
+		users, total = await repository.get_all_with_total(skip=10, limit=2)
+
+		# Assert
+		assert users == []
+		assert total == 1
+
+	async def test_get_all_with_total_empty_table_skips_count(
+		self, repository
+	):
+		"""
+		GIVEN an empty database
+		WHEN getting the first page of users with the total
+		THEN zero is returned without a separate COUNT query
+		"""
+		# Act
+		with patch.object(repository, "count") as mock_count:
+			users, total = await repository.get_all_with_total(
+				skip=0, limit=10
+			)
+
+		# Assert
+		assert users == []
+		assert total == 0
+		mock_count.assert_not_called()
+
+	async def test_get_all_with_total_orders_newest_first(
+		self, repository, test_db_session
+	):
+		"""
+		GIVEN users created at different times
+		WHEN getting a page of users with the total
+		THEN users are ordered from newest to oldest
+		"""
+		# Arrange
+		base = datetime(2024, 1, 1)
+		for i in range(3):
+			test_db_session.add(
+				UserDB(
+					name=f"User {i}",
+					email=f"user{i}@example.com",
+					created_at=base + timedelta(days=i),
+					updated_at=base,
+				)
+			)
+		await test_db_session.flush()
+
+		# Act
+		users, _ = await repository.get_all_with_total(skip=0, limit=10)
+
+		# Assert
+		assert [user.name for user in users] == ["User 2", "User 1", "User 0"]
+
+	async def test_get_all_with_total_orders_back_to_back_creates(
+		self, repository
+	):
+		"""
+		GIVEN two users created back to back with default timestamps
+		WHEN getting a page of users with the total
+		THEN the later user comes first with a later, UTC creation time
+		"""
+		# Arrange
+		first = await repository.create(create_user_data(name="First"))
+		second = await repository.create(create_user_data(name="Second"))
+
+		# Act
+		users, _ = await repository.get_all_with_total(skip=0, limit=10)
+
+		# Assert
+		assert [user.id for user in users] == [second.id, first.id]
+		assert users[0].created_at > users[1].created_at
+		assert all(user.created_at.tzinfo == UTC for user in users)
+
 
 @pytest.mark.unit
 class TestUserRepositoryUpdate:
 	"""Test UserRepository.update method."""
 
-	async def test_update_user_success(self, test_db_session):
+	async def test_update_user_success(self, repository):
 		"""
 		GIVEN an existing user
 		WHEN updating user data
 		THEN user is updated successfully
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
 		user_data = create_user_data(name="Original Name")
 		created_user = await repository.create(user_data)
 
-		from app.models.user import UserUpdate
-
 		update_data = UserUpdate(name="Updated Name")
 
 		# Act
@@ -168,45 +322,34 @@ class TestUserRepositoryUpdate:
 		assert updated_user.email == created_user.email
 		assert updated_user.id == created_user.id
 
-	async def test_update_user_not_found(self, test_db_session):
+	async def test_update_user_not_found(self, repository, nonexistent_id):
 		"""
 		GIVEN a non-existent user id
 		WHEN updating user
 		THEN None is returned
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
-		non_existent_id = uuid4()
-
-		from app.models.user import UserUpdate
-
 		update_data = UserUpdate(name="New Name")
 
 		# Act
-		result = await repository.update(non_existent_id, update_data)
+		result = await repository.update(nonexistent_id, update_data)
 
 		# Assert
 		assert result is None
 
-	async def test_update_user_duplicate_email(self, test_db_session):
+	async def test_update_user_duplicate_email(self, repository):
 		"""
 		GIVEN two existing users
 		WHEN updating one user's email to match another
 		THEN UserAlreadyExistsError is raised
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-
-		# Create two users
+		# Arrange - create two users
 		user1_data = create_user_data(email="user1@example.com")
 		user1 = await repository.create(user1_data)
 
 		user2_data = create_user_data(email="user2@example.com")
 		await repository.create(user2_data)
 
-		from app.exceptions.user_exceptions import UserAlreadyExistsError
-		from app.models.user import UserUpdate
-
 		# Try to update user1's email to user2's email
 		update_data = UserUpdate(email="user2@example.com")
 
@@ -214,23 +357,47 @@ class TestUserRepositoryUpdate:
 		with pytest.raises(UserAlreadyExistsError):
 			await repository.update(user1.id, update_data)
 
-	async def test_update_user_email_to_new_unique_email(
-		self, test_db_session
-	):
+	async def test_update_user_advances_updated_at(self, repository):
+		"""
+		GIVEN a user that was just created
+		WHEN updating the user within the same second
+		THEN updated_at moves past created_at and stays in UTC
+		"""
+		# Arrange
+		user = await repository.create(create_user_data())
+
+		# Act
+		updated = await repository.update(user.id, UserUpdate(name="Renamed"))
+
+		# Assert
+		assert updated.created_at == user.created_at
+		assert updated.updated_at > user.updated_at
+		assert updated.updated_at.tzinfo == UTC
+
+	async def test_update_user_null_name_is_not_a_duplicate(self, repository):
 		"""
 		GIVEN an existing user
-		WHEN updating user's email to a new unique email
-		THEN user is updated successfully
+		WHEN an update bypassing validation writes a null name
+		THEN the NOT NULL IntegrityError propagates untranslated
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
+		user = await repository.create(create_user_data())
+		update_data = UserUpdate.model_construct(name=None)
+
+		# Act & Assert
+		with pytest.raises(IntegrityError):
+			await repository.update(user.id, update_data)
 
-		# Create a user
+	async def test_update_user_email_to_new_unique_email(self, repository):
+		"""
+		GIVEN an existing user
+		WHEN updating user's email to a new unique email
+		THEN user is updated successfully
+		"""
+		# Arrange - create a user
 		user_data = create_user_data(email="original@example.com")
 		user = await repository.create(user_data)
 
-		from app.models.user import UserUpdate
-
 		# Update to a new unique email
 		update_data = UserUpdate(email="newunique@example.com")
 
@@ -247,14 +414,13 @@ class TestUserRepositoryUpdate:
 class TestUserRepositoryDelete:
 	"""Test UserRepository.delete method."""
 
-	async def test_delete_user_success(self, test_db_session):
+	async def test_delete_user_success(self, repository):
 		"""
 		GIVEN an existing user
 		WHEN deleting the user
 		THEN user is deleted and True is returned
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
 		user_data = create_user_data()
 		created_user = await repository.create(user_data)
 
@@ -266,18 +432,14 @@ class TestUserRepositoryDelete:
 		deleted_user = await repository.get_by_id(created_user.id)
 		assert deleted_user is None
 
-	async def test_delete_user_not_found(self, test_db_session):
+	async def test_delete_user_not_found(self, repository, nonexistent_id):
 		"""
 		GIVEN a non-existent user id
 		WHEN deleting user
 		THEN False is returned
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-		non_existent_id = uuid4()
-
 		# Act
-		result = await repository.delete(non_existent_id)
+		result = await repository.delete(nonexistent_id)
 
 		# Assert
 		assert result is False
@@ -287,35 +449,57 @@ class TestUserRepositoryDelete:
 class TestUserRepositoryCount:
 	"""Test UserRepository.count method."""
 
-	async def test_count_users_empty(self, test_db_session):
+	async def test_count_users_empty(self, repository):
 		"""
 		GIVEN an empty database
 		WHEN counting users
 		THEN 0 is returned
 		"""
-		# Arrange
-		repository = UserRepository(test_db_session)
-
 		# Act
 		count = await repository.count()
 
 		# Assert
 		assert count == 0
 
-	async def test_count_users_multiple(self, test_db_session):
+	async def test_count_users_multiple(self, repository, test_db_session):
 		"""
 		GIVEN multiple users in database
 		WHEN counting users
 		THEN correct count is returned
 		"""
 		# Arrange
-		repository = UserRepository(test_db_session)
-		for i in range(3):
-			user_data = create_user_data(email=f"user{i}@example.com")
-			await repository.create(user_data)
+		await insert_users(
+			test_db_session,
+			[
+				{"name": f"User {i}", "email": f"user{i}@example.com"}
+				for i in range(3)
+			],
+		)
 
 		# Act
 		count = await repository.count()
 
 		# Assert
 		assert count == 3
+
+
+@pytest.mark.unit
+class TestBaseRepositoryContract:
+	"""Test BaseRepository implementation checks."""
+
+	def test_sync_method_is_rejected(self):
+		"""
+		GIVEN a repository implementing a method synchronously
+		WHEN defining the repository class
+		THEN TypeError is raised
+		"""
+		# Act & Assert
+		with pytest.raises(TypeError) as exc_info:
+
+			class BlockingRepository(UserRepository):
+				def count(self) -> int:
+					return 0
+
+		assert "BlockingRepository.count must be an async method" in str(
+			exc_info.value
+		)
@@ -1,16 +1,17 @@
 """
-Unit tests for UserService using mocks
+Unit tests for UserService using a fake repository
 Following AAA (Arrange-Act-Assert) pattern
 """
 
-from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
 from app.exceptions.user_exceptions import UserNotFoundError
+from app.models.user import UserUpdate
 from app.services.user_service import UserService
 from tests.factories import create_user, create_user_data
+from tests.helpers import FakeUserRepository
 
 
 @pytest.mark.unit
@@ -19,23 +20,23 @@ class TestUserServiceCreate:
 
 	async def test_create_user_success(self):
 		"""
-		GIVEN valid user data and a mocked repository
+		GIVEN valid user data and a fake repository
 		WHEN creating a new user
 		THEN repository.create is called and user is returned
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		expected_user = create_user(name="John Doe")
-		mock_repository.create.return_value = expected_user
+		repository.create_return = expected_user
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 		user_data = create_user_data(name="John Doe")
 
 		# Act
 		result = await service.create(user_data)
 
 		# Assert
-		mock_repository.create.assert_called_once_with(user_data)
+		assert repository.create_calls == [(user_data,)]
 		assert result == expected_user
 		assert result.name == "John Doe"
 
@@ -46,24 +47,24 @@ class TestUserServiceGetById:
 
 	async def test_get_user_by_id_success(self):
 		"""
-		GIVEN an existing user id and mocked repository
+		GIVEN an existing user id and fake repository
 		WHEN getting user by id
 		THEN repository.get_by_id is called and user is returned
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		excepted_user = create_user(id=user_id)
-		mock_repository.get_by_id.return_value = excepted_user
+		expected_user = create_user(id=user_id)
+		repository.get_by_id_return = expected_user
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 
 		# Act
 		result = await service.get_by_id(user_id)
 
 		# Assert
-		mock_repository.get_by_id.assert_called_once_with(user_id)
-		assert result == excepted_user
+		assert repository.get_by_id_calls == [(user_id,)]
+		assert result == expected_user
 		assert result.id == user_id
 
 	async def test_get_user_by_id_not_found(self):
@@ -73,18 +74,18 @@ class TestUserServiceGetById:
 		THEN UserNotFoundError is raised
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		mock_repository.get_by_id.return_value = None
+		repository.get_by_id_return = None
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 
 		# Act & Assert
 		with pytest.raises(UserNotFoundError) as exc_info:
 			await service.get_by_id(user_id)
 
 		assert str(user_id) in str(exc_info.value)
-		mock_repository.get_by_id.assert_called_once_with(user_id)
+		assert repository.get_by_id_calls == [(user_id,)]
 
 
 @pytest.mark.unit
@@ -93,52 +94,49 @@ class TestUserServiceGetAll:
 
 	async def test_get_all_users_success(self):
 		"""
-		GIVEN multiple users and mocked repository
+		GIVEN multiple users and fake repository
 		WHEN getting all users
-		THEN repository methods are called and users with count are returned
+		THEN page and count are fetched together and returned
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		expected_users = [create_user() for _ in range(3)]
-		mock_repository.get_all.return_value = expected_users
-		mock_repository.count.return_value = 3
+		repository.get_all_with_total_return = (expected_users, 3)
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 
 		# Act
 		users, count = await service.get_all(skip=0, limit=10)
 
 		# Assert
-		mock_repository.get_all.assert_called_once_with(0, 10)
-		mock_repository.count.assert_called_once()
+		assert repository.get_all_with_total_calls == [(0, 10)]
+		assert repository.count_calls == []
 		assert users == expected_users
 		assert count == 3
 		assert len(users) == 3
 
-	async def test_get_all_users_with_pagination_validation(self):
+	@pytest.mark.parametrize(
+		("skip", "limit", "expected"),
+		[(-5, 10, (0, 10)), (0, 200, (0, 10))],
+		ids=["negative-skip", "limit-too-large"],
+	)
+	async def test_get_all_users_with_pagination_validation(
+		self, skip, limit, expected
+	):
 		"""
 		GIVEN invalid pagination parameters
 		WHEN getting all users
-		THEN parameters are validated and corrected
+		THEN parameters are corrected before reaching the repository
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
-		mock_repository.get_all.return_value = []
-		mock_repository.count.return_value = 0
-
-		service = UserService(mock_repository)
-
-		# Act - negative skip
-		await service.get_all(skip=-5, limit=10)
+		repository = FakeUserRepository()
+		service = UserService(repository)
 
-		# Assert - skip should be corrected to 0
-		mock_repository.get_all.assert_called_with(0, 10)
-
-		# Act - invalid limit (too large)
-		await service.get_all(skip=0, limit=200)
+		# Act
+		await service.get_all(skip=skip, limit=limit)
 
-		# Assert - limit should be corrected to 10 (default)
-		mock_repository.get_all.assert_called_with(0, 10)
+		# Assert
+		assert repository.get_all_with_total_calls == [expected]
 
 
 @pytest.mark.unit
@@ -149,20 +147,16 @@ class TestUserServiceUpdate:
 		"""
 		GIVEN an existing user and update data
 		WHEN updating the user
-		THEN user is updated successfully
+		THEN user is updated without a separate existence check
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		existing_user = create_user(id=user_id, name="Old Name")
 		updated_user = create_user(id=user_id, name="New Name")
 
-		mock_repository.get_by_id.return_value = existing_user
-		mock_repository.update.return_value = updated_user
-
-		service = UserService(mock_repository)
+		repository.update_return = updated_user
 
-		from app.models.user import UserUpdate
+		service = UserService(repository)
 
 		update_data = UserUpdate(name="New Name")
 
@@ -170,51 +164,22 @@ class TestUserServiceUpdate:
 		result = await service.update(user_id, update_data)
 
 		# Assert
-		mock_repository.get_by_id.assert_called_once_with(user_id)
-		mock_repository.update.assert_called_once_with(user_id, update_data)
+		assert repository.get_by_id_calls == []
+		assert repository.update_calls == [(user_id, update_data)]
 		assert result.name == "New Name"
 
-	async def test_update_user_not_found_on_get(self):
+	async def test_update_user_not_found(self):
 		"""
 		GIVEN a non-existent user id
 		WHEN updating user
-		THEN UserNotFoundError is raised before update attempt
-		"""
-		# Arrange
-		mock_repository = AsyncMock()
-		user_id = uuid4()
-		mock_repository.get_by_id.return_value = None
-
-		service = UserService(mock_repository)
-
-		from app.models.user import UserUpdate
-
-		update_data = UserUpdate(name="New Name")
-
-		# Act & Assert
-		with pytest.raises(UserNotFoundError):
-			await service.update(user_id, update_data)
-
-		# Update should not be called if user doesn't exist
-		mock_repository.update.assert_not_called()
-
-	async def test_update_user_not_found_after_check(self):
-		"""
-		GIVEN a user that exists during check but not during update
-		WHEN updating user
 		THEN UserNotFoundError is raised
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		existing_user = create_user(id=user_id)
-
-		mock_repository.get_by_id.return_value = existing_user
-		mock_repository.update.return_value = None  # Update returns None
-
-		service = UserService(mock_repository)
+		repository.update_return = None  # Update returns None
 
-		from app.models.user import UserUpdate
+		service = UserService(repository)
 
 		update_data = UserUpdate(name="New Name")
 
@@ -222,7 +187,7 @@ class TestUserServiceUpdate:
 		with pytest.raises(UserNotFoundError):
 			await service.update(user_id, update_data)
 
-		mock_repository.update.assert_called_once_with(user_id, update_data)
+		assert repository.update_calls == [(user_id, update_data)]
 
 
 @pytest.mark.unit
@@ -233,24 +198,22 @@ class TestUserServiceDelete:
 		"""
 		GIVEN an existing user
 		WHEN deleting the user
-		THEN user is deleted successfully
+		THEN user is deleted without a separate existence check
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		existing_user = create_user(id=user_id)
 
-		mock_repository.get_by_id.return_value = existing_user
-		mock_repository.delete.return_value = True
+		repository.delete_return = True
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 
 		# Act
 		result = await service.delete(user_id)
 
 		# Assert
-		mock_repository.get_by_id.assert_called_once_with(user_id)
-		mock_repository.delete.assert_called_once_with(user_id)
+		assert repository.get_by_id_calls == []
+		assert repository.delete_calls == [(user_id,)]
 		assert result is True
 
 	async def test_delete_user_not_found(self):
@@ -260,37 +223,14 @@ class TestUserServiceDelete:
 		THEN UserNotFoundError is raised
 		"""
 		# Arrange
-		mock_repository = AsyncMock()
+		repository = FakeUserRepository()
 		user_id = uuid4()
-		mock_repository.get_by_id.return_value = None
-
-		service = UserService(mock_repository)
-
-		# Act & Assert
-		with pytest.raises(UserNotFoundError):
-			await service.delete(user_id)
-
-		# Delete should not be called if user doesn't exist
-		mock_repository.delete.assert_not_called()
-
-	async def test_delete_user_not_found_after_check(self):
-		"""
-		GIVEN a user that exists during check but not during delete
-		WHEN deleting user
-		THEN UserNotFoundError is raised
-		"""
-		# Arrange
-		mock_repository = AsyncMock()
-		user_id = uuid4()
-		existing_user = create_user(id=user_id)
-
-		mock_repository.get_by_id.return_value = existing_user
-		mock_repository.delete.return_value = False  # Delete returns False
+		repository.delete_return = False  # Delete returns False
 
-		service = UserService(mock_repository)
+		service = UserService(repository)
 
 		# Act & Assert
 		with pytest.raises(UserNotFoundError):
 			await service.delete(user_id)
 
-		mock_repository.delete.assert_called_once_with(user_id)
+		assert repository.delete_calls == [(user_id,)]